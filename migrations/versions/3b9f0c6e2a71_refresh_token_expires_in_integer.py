@@ -0,0 +1,37 @@
+"""refresh_token_expires_in_integer
+
+Revision ID: 3b9f0c6e2a71
+Revises: 7c1e4b2a9d30
+Create Date: 2026-10-15 14:03:27.904116
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9f0c6e2a71'
+down_revision: Union[str, Sequence[str], None] = '7c1e4b2a9d30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('refresh_tokens', 'expires_in',
+               existing_type=sa.Float(),
+               type_=sa.Integer(),
+               existing_nullable=False,
+               existing_comment='Refresh token expiration time in seconds',
+               postgresql_using='expires_in::integer')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('refresh_tokens', 'expires_in',
+               existing_type=sa.Integer(),
+               type_=sa.Float(),
+               existing_nullable=False,
+               existing_comment='Refresh token expiration time in seconds')
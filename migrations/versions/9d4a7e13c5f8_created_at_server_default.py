@@ -0,0 +1,42 @@
+"""created_at_server_default
+
+Revision ID: 9d4a7e13c5f8
+Revises: 3b9f0c6e2a71
+Create Date: 2026-10-15 15:21:09.342871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4a7e13c5f8'
+down_revision: Union[str, Sequence[str], None] = '3b9f0c6e2a71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('authors', 'created_at',
+               existing_type=sa.TIMESTAMP(timezone=True),
+               server_default=sa.text('now()'),
+               existing_nullable=False)
+    op.alter_column('books', 'created_at',
+               existing_type=sa.TIMESTAMP(timezone=True),
+               server_default=sa.text('now()'),
+               existing_nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('books', 'created_at',
+               existing_type=sa.TIMESTAMP(timezone=True),
+               server_default=None,
+               existing_nullable=False)
+    op.alter_column('authors', 'created_at',
+               existing_type=sa.TIMESTAMP(timezone=True),
+               server_default=None,
+               existing_nullable=False)
@@ -24,6 +24,9 @@ async def get_author_from_token(
 
     This dependency function validates the provided JWT access token, extracts
     the author ID, and fetches the full author record from the database.
+    Authors resolved for a token are cached alongside the validated token,
+    so repeated requests with the same token skip both steps. After a
+    lookup the database connection is released before the route runs.
 
     Args:
         token (str): JWT access token provided by the client.
@@ -31,12 +34,21 @@ async def get_author_from_token(
         author_service (AuthorService): Service for fetching author data.
 
     Returns:
-        dict[str, Any]: Dictionary containing the author's data.
+        dict[str, Any]: Dictionary containing the author's data, without
+            the password hash.
 
     Raises:
         AuthorizationException: If the token is invalid or expired.
         AuthorNotFoundByIdException: If no author exists by ID.
 
     """
+    cached_author = auth_service.get_cached_author(token)
+    if cached_author is not None:
+        return cached_author
     author_id = await auth_service.validate_token_for_user(token)
-    return await author_service.get_author_by_id(author_id)
+    author = await author_service.get_author_by_id(author_id)
+    await author_service.release_connection()
+    # Routes never need the password hash, and it must not be cached
+    author.pop('password', None)
+    auth_service.cache_author(token, author)
+    return author
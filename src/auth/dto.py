@@ -1,18 +1,17 @@
 from dataclasses import dataclass
-from datetime import datetime as dt
 
 from src.base.dto import BaseDTO
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AccessTokenDTO(BaseDTO):
     """Data transfer object (DTO) for JWT access tokens.
 
     Attributes:
         sub (str): The subject (usually author/user ID) of the token.
-        exp (datetime): The expiration datetime of the token.
+        exp (int): The expiration time of the token as a UNIX timestamp.
 
     """
 
     sub: str
-    exp: dt
+    exp: int
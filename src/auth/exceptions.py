@@ -1,8 +1,32 @@
+from typing import ClassVar
+
 from fastapi import HTTPException
 
 
 class AuthorizationException(HTTPException):
-    """Base exception for all authentication-related errors."""
+    """Base exception for all authentication-related errors.
+
+    Subclasses describe their response through the ``status_code`` and
+    ``detail`` class attributes instead of overriding ``__init__``.
+
+    Attributes:
+        status_code (int): HTTP status code for the exception.
+        detail (str): Human-readable explanation of the error.
+        response_headers (dict[str, str] | None): Extra response headers.
+
+    """
+
+    status_code: int = 401
+    detail: str = 'Authorization failed'
+    response_headers: ClassVar[dict[str, str] | None] = None
+
+    def __init__(self) -> None:
+        """Initialize the exception from its class attributes."""
+        super().__init__(
+            status_code=self.status_code,
+            detail=self.detail,
+            headers=self.response_headers,
+        )
 
 
 class WrongCredentialsException(AuthorizationException):
@@ -14,12 +38,8 @@ class WrongCredentialsException(AuthorizationException):
 
     """
 
-    def __init__(self) -> None:
-        """Initialize WrongCredentialsException with a default message."""
-        super().__init__(
-            status_code=401,
-            detail='Invalid credentials provided',
-        )
+    status_code = 401
+    detail = 'Invalid credentials provided'
 
 
 class AccessTokenExpiredException(AuthorizationException):
@@ -31,12 +51,8 @@ class AccessTokenExpiredException(AuthorizationException):
 
     """
 
-    def __init__(self) -> None:
-        """Initialize AccessTokenExpiredException with default message."""
-        super().__init__(
-            status_code=401,
-            detail='Access token has expired',
-        )
+    status_code = 401
+    detail = 'Access token has expired'
 
 
 class RefreshTokenException(AuthorizationException):
@@ -48,34 +64,37 @@ class RefreshTokenException(AuthorizationException):
 
     """
 
-    def __init__(self) -> None:
-        """Initialize RefreshTokenException with default message."""
-        super().__init__(
-            status_code=403,
-            detail=(
-                'Cannot process refresh token. It may be expired, invalid, '
-                'or attached to a deleted user.'
-            ),
-        )
+    status_code = 403
+    detail = (
+        'Cannot process refresh token. It may be expired, invalid, '
+        'or attached to a deleted user.'
+    )
 
 
 class NoUpdateDataException(AuthorizationException):
     """Raised when no update data is provided."""
 
-    def __init__(self) -> None:
-        """Initialize the exception with a predefined error message."""
-        super().__init__(
-            status_code=400,
-            detail='No update data provided',
-        )
+    status_code = 400
+    detail = 'No update data provided'
 
 
 class NoFiltersException(AuthorizationException):
     """Raised when no filters are provided for an operation."""
 
-    def __init__(self) -> None:
-        """Initialize the exception with a predefined error message."""
-        super().__init__(
-            status_code=400,
-            detail='No filters provided for operation',
-        )
+    status_code = 400
+    detail = 'No filters provided for operation'
+
+
+class PasswordHashingOverloadedException(AuthorizationException):
+    """Raised when too many password hashes are already waiting to run.
+
+    Attributes:
+        status_code (int): HTTP status code for exception (503 Unavailable).
+        detail (str): Human-readable explanation of the error.
+        response_headers (dict[str, str]): Asks the client to retry shortly.
+
+    """
+
+    status_code = 503
+    detail = 'Too many authentication requests, please retry shortly'
+    response_headers: ClassVar[dict[str, str] | None] = {'Retry-After': '1'}
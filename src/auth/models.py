@@ -14,7 +14,7 @@ class RefreshToken(PrimaryKeyMixin):
 
     Attributes:
         refresh_token (uuid.UUID): Unique UUID used as the refresh token.
-        expires_in (float): Expiration time of the refresh token in seconds.
+        expires_in (int): Expiration time of the refresh token in seconds.
         created_at (datetime): Timestamp when the refresh token was created.
         author_id (int): ID of the author to whom this token belongs.
 
@@ -25,7 +25,7 @@ class RefreshToken(PrimaryKeyMixin):
     refresh_token: Mapped[uuid.UUID] = mapped_column(
         UUID, index=True, comment='Refresh token UUID'
     )
-    expires_in: Mapped[float] = mapped_column(
+    expires_in: Mapped[int] = mapped_column(
         nullable=False, comment='Refresh token expiration time in seconds'
     )
     created_at: Mapped[datetime] = mapped_column(
@@ -34,7 +34,9 @@ class RefreshToken(PrimaryKeyMixin):
         comment='Refresh token creation time',
     )
     author_id: Mapped[int] = mapped_column(
-        ForeignKey('authors.id', ondelete='CASCADE'), comment='Author ID'
+        ForeignKey('authors.id', ondelete='CASCADE'),
+        index=True,
+        comment='Author ID',
     )
 
     def __repr__(self) -> str:
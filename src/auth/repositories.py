@@ -1,16 +1,160 @@
+import uuid
+from functools import lru_cache
+from itertools import combinations
 from typing import Any, cast
 
-from sqlalchemy import text
+from sqlalchemy import (
+    Delete,
+    Select,
+    Table,
+    Update,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.exceptions import NoFiltersException, NoUpdateDataException
+from src.auth.models import RefreshToken
+from src.base.exceptions import ColumnNotAllowedException
 from src.base.query_builder import SecureQueryBuilder
 from src.base.repositories import BaseRepository
 
+_TABLE_NAME = 'refresh_tokens'
+_refresh_tokens = cast(Table, RefreshToken.__table__)
+_SELECT_COLUMNS = (
+    _refresh_tokens.c.id,
+    _refresh_tokens.c.author_id,
+    _refresh_tokens.c.refresh_token,
+    _refresh_tokens.c.expires_in,
+    _refresh_tokens.c.created_at,
+)
+_ALLOWED_FILTERS = frozenset({'id', 'author_id', 'refresh_token'})
+
+
+def _where_criteria(keys: frozenset[str]) -> list[Any]:
+    """Build bound equality criteria for the given filter columns.
+
+    Args:
+        keys (frozenset[str]): Filter column names.
+
+    Returns:
+        list[Any]: Criteria comparing each column to a ``filter_<key>``
+            bind parameter, in sorted column order.
+
+    """
+    return [
+        _refresh_tokens.c[key] == bindparam(f'filter_{key}')
+        for key in sorted(keys)
+    ]
+
+
+def _filter_keys(filters: dict[str, Any]) -> frozenset[str]:
+    """Validate filter names against the filterable columns.
+
+    Args:
+        filters (dict[str, Any]): Column-value filters.
+
+    Returns:
+        frozenset[str]: Filter column names.
+
+    Raises:
+        ColumnNotAllowedException: If a filter is not an allowed column.
+
+    """
+    keys = frozenset(filters)
+    if not keys <= _ALLOWED_FILTERS:
+        raise ColumnNotAllowedException(
+            min(keys - _ALLOWED_FILTERS), _TABLE_NAME
+        )
+    return keys
+
+
+def _filter_params(filters: dict[str, Any]) -> dict[str, Any]:
+    """Map filter values to the bind parameter names used in statements.
+
+    Args:
+        filters (dict[str, Any]): Column-value filters.
+
+    Returns:
+        dict[str, Any]: Filter values keyed by ``filter_<key>``.
+
+    """
+    return {f'filter_{key}': value for key, value in filters.items()}
+
+
+@lru_cache(maxsize=32)
+def _update_statement(fields: frozenset[str], keys: frozenset[str]) -> Update:
+    """Return a cached UPDATE statement for the given columns.
+
+    Args:
+        fields (frozenset[str]): Column names to update. Values are bound
+            as ``set_<field>`` parameters.
+        keys (frozenset[str]): Filter column names.
+
+    Returns:
+        Update: Statement updating matching refresh tokens.
+
+    """
+    values: dict[str, Any] = {
+        SecureQueryBuilder.validate_column(_TABLE_NAME, field): bindparam(
+            f'set_{field}'
+        )
+        for field in sorted(fields)
+    }
+    return (
+        update(_refresh_tokens)
+        .where(*_where_criteria(keys))
+        .values(values)
+        .returning(*_SELECT_COLUMNS)
+    )
+
+
+_INSERT_STATEMENT = insert(_refresh_tokens).returning(_refresh_tokens.c.id)
+_expires_at = _refresh_tokens.c.created_at + _refresh_tokens.c.expires_in * (
+    literal_column("interval '1 second'")
+)
+_DELETE_EXPIRED_STATEMENT = delete(_refresh_tokens).where(
+    _refresh_tokens.c.author_id == bindparam('author_id'),
+    _expires_at < func.now(),
+)
+_ROTATE_STATEMENT = (
+    update(_refresh_tokens)
+    .where(
+        _refresh_tokens.c.refresh_token == bindparam('old_refresh_token'),
+        _expires_at > func.now(),
+    )
+    .values(
+        refresh_token=bindparam('new_refresh_token'),
+        expires_in=bindparam('new_expires_in'),
+    )
+    .returning(_refresh_tokens.c.author_id)
+)
+_FILTER_SETS = [
+    frozenset(keys)
+    for size in range(1, len(_ALLOWED_FILTERS) + 1)
+    for keys in combinations(sorted(_ALLOWED_FILTERS), size)
+]
+# Every allowed filter combination mapped to its prebuilt statement.
+_SELECT_STATEMENTS: dict[frozenset[str], Select[Any]] = {
+    keys: select(*_SELECT_COLUMNS).where(*_where_criteria(keys)).limit(1)
+    for keys in _FILTER_SETS
+}
+_DELETE_STATEMENTS: dict[frozenset[str], Delete] = {
+    keys: delete(_refresh_tokens).where(*_where_criteria(keys))
+    for keys in _FILTER_SETS
+}
+
 
 class AuthRepository(BaseRepository):
     """Repository for managing refresh tokens in the database."""
 
+    __slots__ = ()
+
     def __init__(self, session: AsyncSession):
         """Initialize the repository with an async database session.
 
@@ -31,15 +175,10 @@ class AuthRepository(BaseRepository):
             int: ID of the newly created refresh token.
 
         """
-        sql = text("""
-                   INSERT INTO refresh_tokens (author_id, refresh_token,
-                                               expires_in, created_at)
-                   VALUES (:author_id, :refresh_token, :expires_in, NOW())
-                   RETURNING id
-                   """)
-        async with self._session.begin():
-            result = await self._session.execute(sql, params)
-            return cast(int, result.scalar_one())
+        result = await self._session.execute(_INSERT_STATEMENT, params)
+        object_id = cast(int, result.scalar_one())
+        await self._session.commit()
+        return object_id
 
     async def get_object(self, **filters: Any) -> dict[str, Any] | None:
         """Retrieve a refresh token record matching the given filters.
@@ -55,22 +194,10 @@ class AuthRepository(BaseRepository):
         if not filters:
             return None
 
-        conditions = [(key, '=', key) for key in filters]
-        where_clause, safe_params = SecureQueryBuilder.build_where_clause(
-            'refresh_tokens', conditions, filters
-        )
-
-        sql = text(
-            'SELECT id, author_id, refresh_token, expires_in, created_at '
-            'FROM refresh_tokens '
-            'WHERE ' + where_clause + ' '
-            'LIMIT 1'
-        )
-
-        async with self._session.begin():
-            result = await self._session.execute(sql, safe_params)
-            row = result.mappings().first()
-            return dict(row) if row else None
+        sql = _SELECT_STATEMENTS[_filter_keys(filters)]
+        result = await self._session.execute(sql, _filter_params(filters))
+        row = result.first()
+        return row._asdict() if row else None
 
     async def update_object(
         self,
@@ -92,48 +219,79 @@ class AuthRepository(BaseRepository):
         if not filters:
             raise NoFiltersException
 
-        set_clause, set_params = SecureQueryBuilder.build_set_clause(
-            'refresh_tokens',
-            list(update_data.keys()),
-            {f'set_{k}': v for k, v in update_data.items()},
-        )
+        sql = _update_statement(frozenset(update_data), _filter_keys(filters))
+        params = {f'set_{k}': v for k, v in update_data.items()}
+        params.update(_filter_params(filters))
+        result = await self._session.execute(sql, params)
+        row = result.first()
+        await self._session.commit()
+        return row._asdict() if row else None
 
-        where_conditions = [(key, '=', key) for key in filters]
-        where_clause, where_params = SecureQueryBuilder.build_where_clause(
-            'refresh_tokens', where_conditions, filters
-        )
-
-        # Combine parameters
-        params = {**set_params, **where_params}
-
-        sql = text(
-            'UPDATE refresh_tokens '
-            'SET ' + set_clause + ' '
-            'WHERE ' + where_clause + ' '
-            'RETURNING *'
-        )
-        async with self._session.begin():
-            result = await self._session.execute(sql, params)
-            row = result.mappings().first()
-            return dict(row) if row else None
-
-    async def delete_object(self, **filters: Any) -> None:
-        """Delete a token matching the given filters.
+    async def delete_object(self, **filters: Any) -> int:
+        """Delete tokens matching the given filters.
 
         Args:
             **filters (Any): Column-value filters to identify the token.
 
+        Returns:
+            int: Number of deleted tokens.
+
         """
         if not filters:
             raise NoFiltersException
 
-        where_conditions = [(key, '=', key) for key in filters]
-        where_clause, safe_params = SecureQueryBuilder.build_where_clause(
-            'refresh_tokens', where_conditions, filters
+        sql = _DELETE_STATEMENTS[_filter_keys(filters)]
+        result = await self._session.execute(sql, _filter_params(filters))
+        await self._session.commit()
+        return result.rowcount
+
+    async def delete_expired_objects(self, author_id: int) -> int:
+        """Delete an author's refresh tokens that have already expired.
+
+        Args:
+            author_id (int): ID of the author whose tokens are purged.
+
+        Returns:
+            int: Number of deleted tokens.
+
+        """
+        result = await self._session.execute(
+            _DELETE_EXPIRED_STATEMENT, {'author_id': author_id}
         )
+        await self._session.commit()
+        return result.rowcount
+
+    async def rotate_object(
+        self,
+        refresh_token: uuid.UUID,
+        new_refresh_token: uuid.UUID,
+        expires_in: int,
+    ) -> int | None:
+        """Replace an unexpired refresh token with a new one.
 
-        # where_clause is validated by SecureQueryBuilder, so this is safe
-        sql = text('DELETE FROM refresh_tokens WHERE ' + where_clause)  # noqa: S608
+        The lookup, the expiry check and the update run as one statement,
+        so a token can only be rotated once even under concurrent
+        requests. Tokens of deleted authors are removed by the foreign
+        key cascade and are therefore never rotated.
 
-        async with self._session.begin():
-            await self._session.execute(sql, safe_params)
+        Args:
+            refresh_token (uuid.UUID): Current refresh token.
+            new_refresh_token (uuid.UUID): Refresh token replacing it.
+            expires_in (int): Lifetime of the new token in seconds.
+
+        Returns:
+            int | None: ID of the token's author, or None if the token
+            does not exist or has expired.
+
+        """
+        result = await self._session.execute(
+            _ROTATE_STATEMENT,
+            {
+                'old_refresh_token': refresh_token,
+                'new_refresh_token': new_refresh_token,
+                'new_expires_in': expires_in,
+            },
+        )
+        author_id = cast(int | None, result.scalar_one_or_none())
+        await self._session.commit()
+        return author_id
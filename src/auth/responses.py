@@ -2,6 +2,8 @@
 
 from typing import Any
 
+from src.auth.schemas import TokenSchemas
+
 # Common responses
 UNAUTHORIZED_RESPONSE: dict[int | str, dict[str, Any]] = {
     401: {
@@ -38,6 +40,7 @@ VALIDATION_ERROR_RESPONSE: dict[int | str, dict[str, Any]] = {
 LOGIN_RESPONSES: dict[int | str, dict[str, Any]] = {
     200: {
         'description': 'Successfully authenticated',
+        'model': TokenSchemas,
         'content': {
             'application/json': {
                 'example': {
@@ -82,6 +85,7 @@ GET_ME_RESPONSES: dict[int | str, dict[str, Any]] = {
 REFRESH_TOKEN_RESPONSES: dict[int | str, dict[str, Any]] = {
     200: {
         'description': 'Successfully refreshed tokens',
+        'model': TokenSchemas,
         'content': {
             'application/json': {
                 'example': {
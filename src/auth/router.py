@@ -1,4 +1,3 @@
-import uuid
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends
@@ -15,15 +14,13 @@ from src.auth.schemas import RefreshTokenRequestSchema, TokenSchemas
 from src.auth.services.auth import AuthService
 from src.authors.schemas import GetAuthorResponseSchema
 from src.base.dependencies import get_service
-from src.settings import Settings
+from src.base.responses import PydanticJSONResponse
 
 auth_router = APIRouter(prefix='/auth', tags=['auth'])
-settings = Settings.load()
 
 
 @auth_router.post(
     path='/login',
-    response_model=TokenSchemas,
     summary='User login',
     description=(
         'Authenticate user with email and password to get access to tokens.'
@@ -33,7 +30,7 @@ settings = Settings.load()
 async def login_user(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     service: Annotated[AuthService, Depends(get_service(AuthService))],
-) -> TokenSchemas:
+) -> PydanticJSONResponse:
     """Authenticate user and return access and refresh tokens.
 
     Args:
@@ -41,7 +38,7 @@ async def login_user(
         service (AuthService): Auth service dependency.
 
     Returns:
-        TokenSchemas: Access and refresh tokens with type.
+        PydanticJSONResponse: Access and refresh tokens with type.
 
     """
     author_data = await service.auth_user(
@@ -49,7 +46,7 @@ async def login_user(
         password=form_data.password,
     )
     token: TokenSchemas = await service.create_token(author_data['id'])
-    return token
+    return PydanticJSONResponse(token)
 
 
 @auth_router.get(
@@ -61,23 +58,22 @@ async def login_user(
     responses=GET_ME_RESPONSES,
 )
 async def get_me(
-    author: Annotated[dict[str, Any] | None, Depends(get_author_from_token)],
+    author: Annotated[dict[str, Any], Depends(get_author_from_token)],
 ) -> GetAuthorResponseSchema:
     """Retrieve the current authenticated author's profile.
 
     Args:
-        author (dict[str, Any] | None): Author info from token dependency.
+        author (dict[str, Any]): Author info from token dependency.
 
     Returns:
         GetAuthorResponseSchema: Current author details.
 
     """
-    return GetAuthorResponseSchema.model_validate(author)
+    return GetAuthorResponseSchema.model_construct(**author)
 
 
 @auth_router.post(
     path='/refresh',
-    response_model=TokenSchemas,
     summary='Refresh access token',
     description='Get new access and refresh tokens using a valid one.',
     responses=REFRESH_TOKEN_RESPONSES,
@@ -85,7 +81,7 @@ async def get_me(
 async def refresh_token(
     refresh_request: Annotated[RefreshTokenRequestSchema, Depends()],
     service: Annotated[AuthService, Depends(get_service(AuthService))],
-) -> TokenSchemas:
+) -> PydanticJSONResponse:
     """Refresh access and refresh tokens using a valid refresh token.
 
     Args:
@@ -94,13 +90,13 @@ async def refresh_token(
         service (AuthService): Auth service dependency.
 
     Returns:
-        TokenSchemas: New access and refresh tokens.
+        PydanticJSONResponse: New access and refresh tokens.
 
     """
     token: TokenSchemas = await service.refresh_token(
-        refresh_token=uuid.UUID(refresh_request.refresh_token),
+        refresh_token=refresh_request.refresh_token,
     )
-    return token
+    return PydanticJSONResponse(token)
 
 
 @auth_router.delete(
@@ -125,4 +121,4 @@ async def logout_user(
         None
 
     """
-    await service.logout_user(uuid.UUID(refresh_request.refresh_token))
+    await service.logout_user(refresh_request.refresh_token)
@@ -42,21 +42,21 @@ class CreateRefreshTokenSchema(BaseSchema):
     Attributes:
         author_id (int): ID of the author the refresh token belongs to.
         refresh_token (uuid.UUID): The UUID refresh token value.
-        expires_in (float): Expiration time in seconds.
+        expires_in (int): Expiration time in seconds.
 
     """
 
     author_id: int
     refresh_token: uuid.UUID
-    expires_in: float
+    expires_in: int
 
 
 class RefreshTokenRequestSchema(BaseSchema):
     """Schema representing a request to refresh an access token.
 
     Attributes:
-        refresh_token (str): The refresh token provided by the client.
+        refresh_token (uuid.UUID): The refresh token provided by the client.
 
     """
 
-    refresh_token: str
+    refresh_token: uuid.UUID
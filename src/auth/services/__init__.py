@@ -1,5 +1,6 @@
 from .auth import AuthService
+from .cache import CachingTokenValidator
 from .hasher import Hasher
 from .token import TokenManager
 
-__all__ = ['AuthService', 'Hasher', 'TokenManager']
+__all__ = ['AuthService', 'CachingTokenValidator', 'Hasher', 'TokenManager']
@@ -1,81 +1,128 @@
+import time
 import uuid
-from typing import Any
+from functools import cached_property
+from typing import Any, cast
 
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
 from src.auth.exceptions import RefreshTokenException, WrongCredentialsException
 from src.auth.repositories import AuthRepository
 from src.auth.schemas import CreateRefreshTokenSchema, TokenSchemas
+from src.auth.services.cache import CachingTokenValidator, token_validator
 from src.auth.services.hasher import Hasher
 from src.auth.services.token import TokenManager
 from src.authors.repositories import AuthorRepository
-from src.base.repositories import BaseRepository
 from src.base.services import BaseService
 
+# Checked instead of a real hash for unknown emails, so they cost as much
+# as a wrong password and do not reveal which emails are registered.
+_DUMMY_PASSWORD_HASH = Hasher.hash_password('!not-a-real-password!')
+
 
 class AuthService(BaseService):
     """Service responsible for author authentication and JWT management."""
 
+    _repo: AuthRepository
+
     def __init__(
         self,
         db_session: AsyncSession,
-        auth_repo: BaseRepository | None = None,
-        author_repo: BaseRepository | None = None,
+        auth_repo: AuthRepository | None = None,
+        author_repo: AuthorRepository | None = None,
+        token_cache: CachingTokenValidator | None = None,
     ) -> None:
         """Initialize the authentication service.
 
         Args:
             db_session (AsyncSession): SQLAlchemy async session.
-            auth_repo (BaseRepository | None): Repository for refresh tokens.
-            author_repo (BaseRepository | None): Repository for authors.
+            auth_repo (AuthRepository | None): Repository for refresh tokens.
+            author_repo (AuthorRepository | None): Repository for authors.
+            token_cache (CachingTokenValidator | None): Cache of validated
+                access tokens, shared process-wide by default.
 
         """
         super().__init__(
             db_session, repo=auth_repo or AuthRepository(db_session)
         )
-        self._author_repo = author_repo or AuthorRepository(db_session)
+        if author_repo is not None:
+            self._author_repo = author_repo
+        self._token_cache = (
+            token_validator if token_cache is None else token_cache
+        )
 
-    @staticmethod
-    def _verify_user_password(author_password: str, password: str) -> None:
+    @cached_property
+    def _author_repo(self) -> AuthorRepository:
+        """Return the author repository, creating it on first use.
+
+        Token validation never touches authors, so the repository is only
+        built for the login and refresh flows that need it.
+
+        Returns:
+            AuthorRepository: Repository for authors.
+
+        """
+        return AuthorRepository(self._session)
+
+    async def _verify_user_password(
+        self, author_data: dict[str, Any] | None, password: str
+    ) -> None:
         """Verify that the provided password matches the stored password.
 
+        The bcrypt check runs on the hasher's thread pool so it does not
+        block the event loop. It runs even when the author does not exist,
+        against a dummy hash, so response times do not reveal whether an
+        email is registered. A stored hash created with outdated bcrypt
+        settings is replaced after a successful check, and the author's
+        cached tokens are evicted.
+
         Args:
-            author_password (str): Hashed password from the database.
+            author_data (dict[str, Any] | None): Author record from the
+                database, or None if no author matched.
             password (str): Plain password provided by user.
 
         Raises:
-            WrongCredentialsException: If password does not match.
+            WrongCredentialsException: If the author does not exist or the
+                password does not match.
 
         """
-        if not author_password or not Hasher.verify_password(
-            password, author_password
-        ):
+        author_password = author_data.get('password') if author_data else None
+        is_valid, new_hash = await Hasher.verify_and_update_async(
+            password, author_password or _DUMMY_PASSWORD_HASH
+        )
+        if author_data is None or not author_password or not is_valid:
             raise WrongCredentialsException
+        if new_hash is not None:
+            await self._author_repo.update_object(
+                {'password': new_hash}, id=author_data['id']
+            )
+            self._token_cache.evict_author(author_data['id'])
 
     async def auth_user(self, email: str, password: str) -> dict[str, Any]:
         """Authenticate an author using email and password.
 
+        Only the author's ID and password hash are loaded for the check.
+
         Args:
             email (str): Author's email.
             password (str): Plain text password.
 
         Returns:
-            dict[str, Any]: Author data from the database.
+            dict[str, Any]: Author ``id`` and hashed ``password``.
 
         Raises:
             WrongCredentialsException: If email or password are invalid.
 
         """
-        author_data = await self._author_repo.get_object(email=email)
-        if not author_data:
-            raise WrongCredentialsException
-        author_password = author_data.get('password', '')
-        self._verify_user_password(author_password, password)
-        return author_data
+        author_data = await self._author_repo.get_auth_credentials(email)
+        await self._verify_user_password(author_data, password)
+        return cast(dict[str, Any], author_data)
 
     async def create_token(self, author_id: int) -> TokenSchemas:
         """Generate access and refresh tokens for an author.
 
+        Every login stores a new refresh token, so the author's expired
+        ones are purged first to keep the table from growing unbounded.
+
         Args:
             author_id (int): ID of the author.
 
@@ -86,21 +133,26 @@ class AuthService(BaseService):
         access_token: str = TokenManager.generate_access_token(
             author_id=author_id
         )
-        refresh_token, tm_delta = TokenManager.generate_refresh_token()
+        refresh_token, expires_in = TokenManager.generate_refresh_token()
         create_token_schema = CreateRefreshTokenSchema(
             author_id=author_id,
             refresh_token=refresh_token,
-            expires_in=tm_delta.total_seconds(),
+            expires_in=expires_in,
         )
+        await self._repo.delete_expired_objects(author_id)
         await self._repo.create_object(create_token_schema.model_dump())
-        return TokenSchemas(
+        return TokenSchemas.model_construct(
             access_token=access_token,
             refresh_token=str(refresh_token),
+            token_type='Bearer',  # noqa: S106
         )
 
     async def refresh_token(self, refresh_token: uuid.UUID) -> TokenSchemas:
         """Refresh access and refresh tokens using a valid refresh token.
 
+        The refresh token is validated and rotated in a single database
+        round trip.
+
         Args:
             refresh_token (uuid.UUID): Existing refresh token.
 
@@ -111,34 +163,21 @@ class AuthService(BaseService):
             RefreshTokenException: If refresh token is invalid or expired.
 
         """
-        refresh_token_model = await self._repo.get_object(
-            refresh_token=refresh_token
+        updated_refresh_token, expires_in = (
+            TokenManager.generate_refresh_token()
         )
-        if not refresh_token_model:
-            raise RefreshTokenException
-        TokenManager.validate_refresh_token_expired(
-            refresh_token_model=refresh_token_model,
+        author_id = await self._repo.rotate_object(
+            refresh_token, updated_refresh_token, expires_in
         )
-        author_id: int = refresh_token_model['author_id']
-        author = await self._author_repo.get_object(id=author_id)
-        if not author:
+        if author_id is None:
             raise RefreshTokenException
         access_token: str = TokenManager.generate_access_token(
             author_id=author_id,
         )
-        updated_refresh_token, tm_delta = TokenManager.generate_refresh_token()
-        updated_token = await self._repo.update_object(
-            {
-                'refresh_token': updated_refresh_token,
-                'expires_in': tm_delta.total_seconds(),
-            },
-            id=refresh_token_model['id'],
-        )
-        if not updated_token:
-            raise RefreshTokenException
-        return TokenSchemas(
+        return TokenSchemas.model_construct(
             access_token=access_token,
             refresh_token=str(updated_refresh_token),
+            token_type='Bearer',  # noqa: S106
         )
 
     async def logout_user(
@@ -147,6 +186,9 @@ class AuthService(BaseService):
     ) -> None:
         """Logout a user by deleting their refresh token.
 
+        The token is deleted with a single statement, without loading it
+        first.
+
         Args:
             refresh_token (uuid.UUID | None): Refresh token to delete.
 
@@ -156,12 +198,9 @@ class AuthService(BaseService):
         """
         if not refresh_token:
             raise RefreshTokenException
-        refresh_token_model = await self._repo.get_object(
-            refresh_token=refresh_token,
-        )
-        if not refresh_token_model:
+        deleted = await self._repo.delete_object(refresh_token=refresh_token)
+        if not deleted:
             raise RefreshTokenException
-        await self._repo.delete_object(id=refresh_token_model['id'])
 
     @staticmethod
     def _get_user_id_from_jwt(decoded_jwt: dict[str, str | int]) -> str:
@@ -182,9 +221,34 @@ class AuthService(BaseService):
             raise WrongCredentialsException
         return user_id
 
+    def get_cached_author(self, user_jwt_token: str) -> dict[str, Any] | None:
+        """Return the author cached for an already validated token.
+
+        Args:
+            user_jwt_token (str): JWT access token.
+
+        Returns:
+            dict[str, Any] | None: Author data, or None on a cache miss.
+
+        """
+        return self._token_cache.get_author(user_jwt_token)
+
+    def cache_author(self, user_jwt_token: str, author: dict[str, Any]) -> None:
+        """Remember the author loaded for a validated token.
+
+        Args:
+            user_jwt_token (str): JWT access token.
+            author (dict[str, Any]): Author data loaded for the token.
+
+        """
+        self._token_cache.set_author(user_jwt_token, author)
+
     async def validate_token_for_user(self, user_jwt_token: str) -> int | str:
         """Validate an access token and extract the user ID.
 
+        Only invalid tokens are remembered as such; an expired token is
+        rejected without being added to the negative cache.
+
         Args:
             user_jwt_token (str): JWT access token.
 
@@ -192,14 +256,26 @@ class AuthService(BaseService):
             int | str: User ID extracted from the token.
 
         Raises:
-            WrongCredentialsException: If token is invalid or expired.
+            WrongCredentialsException: If token is invalid.
+            AccessTokenExpiredException: If token is expired.
 
         """
-        decoded_jwt: dict[str, str | int] = TokenManager.decode_access_token(
-            token=user_jwt_token,
-        )
-        TokenManager.validate_access_token_expired(decoded_jwt)
-        user_id: int | str = self._get_user_id_from_jwt(decoded_jwt)
-        if not user_id:
+        cached_user_id = self._token_cache.get(user_jwt_token)
+        if cached_user_id is not None:
+            return cached_user_id
+        if self._token_cache.is_invalid(user_jwt_token):
             raise WrongCredentialsException
+        now = time.time()
+        try:
+            decoded_jwt: dict[str, str | int] = (
+                TokenManager.decode_access_token(token=user_jwt_token, now=now)
+            )
+            TokenManager.validate_access_token_expired(decoded_jwt, now=now)
+            user_id: int | str = self._get_user_id_from_jwt(decoded_jwt)
+        except WrongCredentialsException:
+            self._token_cache.set_invalid(user_jwt_token)
+            raise
+        self._token_cache.set(
+            user_jwt_token, str(user_id), float(decoded_jwt['exp'])
+        )
         return user_id
@@ -0,0 +1,201 @@
+import hashlib
+import time
+from typing import Any
+
+from src.settings import Settings
+
+settings = Settings.load()
+
+
+class CachingTokenValidator:
+    """In-process TTL cache for already validated access tokens.
+
+    Entries map a 128-bit BLAKE2b digest of an access token to the author ID
+    extracted from it, so keys stay small regardless of token length, and
+    expire together with the token itself, so a cached token is never
+    accepted after its own ``exp`` claim. Only successfully validated tokens
+    are stored. An entry can additionally carry the author record loaded for
+    the token, letting warm tokens resolve the author without a query. The
+    password hash is never cached, and entries of an author are evicted
+    when the author's row is updated.
+
+    Tokens that failed validation are remembered separately for a few
+    seconds, so replaying the same malformed token does not repeat the
+    signature check.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        max_ttl: int = 3600,
+        invalid_ttl: int = 5,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size (int): Maximum number of cached tokens.
+            max_ttl (int): Upper bound for an entry lifetime in seconds.
+            invalid_ttl (int): Lifetime of invalid token entries in seconds.
+
+        """
+        self._max_size = max_size
+        self._max_ttl = max_ttl
+        self._invalid_ttl = invalid_ttl
+        self._invalid: dict[bytes, float] = {}
+        self._entries: dict[
+            bytes, tuple[str, float, dict[str, Any] | None]
+        ] = {}
+
+    @staticmethod
+    def _make_key(token: str) -> bytes:
+        """Return the cache key for a token.
+
+        Args:
+            token (str): JWT access token.
+
+        Returns:
+            bytes: 16-byte BLAKE2b digest of the token.
+
+        """
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def _get_entry(
+        self, token: str
+    ) -> tuple[str, float, dict[str, Any] | None] | None:
+        """Return a live cache entry for a token, dropping expired ones.
+
+        Args:
+            token (str): JWT access token.
+
+        Returns:
+            tuple[str, float, dict[str, Any] | None] | None: Author ID,
+                expiration timestamp and cached author record, or None.
+
+        """
+        key = self._make_key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.time():
+            self._entries.pop(key, None)
+            return None
+        return entry
+
+    def get(self, token: str) -> str | None:
+        """Return the cached author ID for a token.
+
+        Args:
+            token (str): JWT access token.
+
+        Returns:
+            str | None: Author ID, or None if the token is not cached or
+                its entry has expired.
+
+        """
+        entry = self._get_entry(token)
+        return entry[0] if entry else None
+
+    def get_author(self, token: str) -> dict[str, Any] | None:
+        """Return the cached author record for a token.
+
+        Args:
+            token (str): JWT access token.
+
+        Returns:
+            dict[str, Any] | None: Copy of the author record, or None if
+                the token or its author is not cached.
+
+        """
+        entry = self._get_entry(token)
+        if not entry or entry[2] is None:
+            return None
+        return dict(entry[2])
+
+    def set_author(self, token: str, author: dict[str, Any]) -> None:
+        """Attach an author record to an already cached token.
+
+        Args:
+            token (str): JWT access token.
+            author (dict[str, Any]): Author record loaded for the token.
+
+        """
+        key = self._make_key(token)
+        entry = self._entries.get(key)
+        if entry is not None:
+            cached = {k: v for k, v in author.items() if k != 'password'}
+            self._entries[key] = (entry[0], entry[1], cached)
+
+    def evict_author(self, author_id: int | str) -> None:
+        """Drop every cached token of an author.
+
+        Called after the author's row changes, so no stale author record is
+        served from the cache.
+
+        Args:
+            author_id (int | str): ID of the updated author.
+
+        """
+        user_id = str(author_id)
+        stale = [k for k, v in self._entries.items() if v[0] == user_id]
+        for key in stale:
+            del self._entries[key]
+
+    def set(self, token: str, user_id: str, exp: float) -> None:
+        """Store a validated token until its expiration.
+
+        Args:
+            token (str): JWT access token.
+            user_id (str): Author ID extracted from the token.
+            exp (float): Token expiration as a UNIX timestamp.
+
+        """
+        now = time.time()
+        expires_at = min(exp, now + self._max_ttl)
+        if expires_at <= now:
+            return
+        key = self._make_key(token)
+        if key not in self._entries and len(self._entries) >= self._max_size:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (user_id, expires_at, None)
+
+    def is_invalid(self, token: str) -> bool:
+        """Check whether a token recently failed validation.
+
+        Args:
+            token (str): JWT access token.
+
+        Returns:
+            bool: True if the token is remembered as invalid.
+
+        """
+        key = self._make_key(token)
+        expires_at = self._invalid.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= time.time():
+            self._invalid.pop(key, None)
+            return False
+        return True
+
+    def set_invalid(self, token: str) -> None:
+        """Remember a token that failed validation.
+
+        Args:
+            token (str): JWT access token.
+
+        """
+        key = self._make_key(token)
+        if key not in self._invalid and len(self._invalid) >= self._max_size:
+            self._invalid.pop(next(iter(self._invalid)))
+        self._invalid[key] = time.time() + self._invalid_ttl
+
+    def clear(self) -> None:
+        """Remove all cached tokens."""
+        self._entries.clear()
+        self._invalid.clear()
+
+
+token_validator = CachingTokenValidator(
+    max_size=settings.token_settings.CACHE_MAX_SIZE,
+    max_ttl=settings.token_settings.CACHE_TTL_SECONDS,
+)
@@ -1,13 +1,91 @@
-from passlib.context import CryptContext
+import asyncio
+import weakref
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import bcrypt
+
+from src.auth.exceptions import PasswordHashingOverloadedException
+from src.settings import Settings
+
+settings = Settings.load()
 
 
 class Hasher:
-    """Utility class for hashing and verifying passwords using bcrypt."""
+    """Utility class for hashing and verifying passwords using bcrypt.
+
+    The async variants run bcrypt on a dedicated thread pool, so slow hashes
+    neither block the event loop nor compete with other work for the
+    default executor. At most one hash per worker is handed to the pool;
+    further calls wait, and once too many are waiting new ones are rejected
+    instead of queueing without bound.
+
+    Hashes use the configured number of bcrypt rounds. Hashes created with
+    a different cost or variant are reported as outdated on verification,
+    so callers can replace them after a successful login. The ``bcrypt``
+    package is called directly, since a single scheme gains nothing from
+    passlib's scheme dispatch.
+    """
 
-    _crypt_context: CryptContext = CryptContext(
-        schemes=['bcrypt'],
-        deprecated='auto',
+    _rounds: int = settings.bcrypt_settings.ROUNDS
+    _current_prefix: bytes = b'$2b$%02d$' % settings.bcrypt_settings.ROUNDS
+    _executor: ThreadPoolExecutor = ThreadPoolExecutor(
+        max_workers=settings.bcrypt_settings.WORKERS,
+        thread_name_prefix='bcrypt',
     )
+    _semaphores: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, asyncio.Semaphore
+    ] = weakref.WeakKeyDictionary()
+    _pending: int = 0
+    _max_pending: int = settings.bcrypt_settings.MAX_PENDING
+
+    @classmethod
+    def _get_semaphore(cls: type['Hasher']) -> asyncio.Semaphore:
+        """Return the worker semaphore for the running event loop.
+
+        Semaphores are bound to the loop that first waits on them, so one
+        is created lazily per loop rather than once at import time.
+
+        Returns:
+            asyncio.Semaphore: Semaphore limiting hashes handed to the pool.
+
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = cls._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(settings.bcrypt_settings.WORKERS)
+            cls._semaphores[loop] = semaphore
+        return semaphore
+
+    @classmethod
+    async def _run_in_executor[T](
+        cls: type['Hasher'], func: Callable[..., T], *args: Any
+    ) -> T:
+        """Run a bcrypt operation on the thread pool with backpressure.
+
+        Args:
+            func (Callable[..., T]): Blocking hashing function.
+            *args (Any): Arguments passed to the function.
+
+        Returns:
+            T: Result of the function.
+
+        Raises:
+            PasswordHashingOverloadedException: If too many operations are
+                already pending.
+
+        """
+        if cls._pending >= cls._max_pending:
+            raise PasswordHashingOverloadedException
+        cls._pending += 1
+        try:
+            async with cls._get_semaphore():
+                return await asyncio.get_running_loop().run_in_executor(
+                    cls._executor, func, *args
+                )
+        finally:
+            cls._pending -= 1
 
     @classmethod
     def hash_password(cls: type['Hasher'], unhashed_password: str) -> str:
@@ -20,7 +98,9 @@ class Hasher:
             str: The hashed password.
 
         """
-        return cls._crypt_context.hash(unhashed_password)
+        return bcrypt.hashpw(
+            unhashed_password.encode(), bcrypt.gensalt(rounds=cls._rounds)
+        ).decode()
 
     @classmethod
     def verify_password(
@@ -38,4 +118,97 @@ class Hasher:
             bool: True if the password matches the hash, False otherwise.
 
         """
-        return cls._crypt_context.verify(unhashed_password, hashed_password)
+        return bcrypt.checkpw(
+            unhashed_password.encode(), hashed_password.encode()
+        )
+
+    @classmethod
+    def verify_and_update(
+        cls: type['Hasher'],
+        unhashed_password: str,
+        hashed_password: str,
+    ) -> tuple[bool, str | None]:
+        """Verify a password and rehash it if its hash is outdated.
+
+        Args:
+            unhashed_password (str): The plain text password to verify.
+            hashed_password (str): The previously hashed password.
+
+        Returns:
+            tuple[bool, str | None]: Whether the password matches, and a
+                replacement hash if the stored one uses outdated settings.
+
+        """
+        if not cls.verify_password(unhashed_password, hashed_password):
+            return False, None
+        if hashed_password.encode().startswith(cls._current_prefix):
+            return True, None
+        return True, cls.hash_password(unhashed_password)
+
+    @classmethod
+    async def hash_password_async(
+        cls: type['Hasher'], unhashed_password: str
+    ) -> str:
+        """Hash a plain text password on the bcrypt thread pool.
+
+        Args:
+            unhashed_password (str): The plain text password to hash.
+
+        Returns:
+            str: The hashed password.
+
+        Raises:
+            PasswordHashingOverloadedException: If too many hashes are
+                already pending.
+
+        """
+        return await cls._run_in_executor(cls.hash_password, unhashed_password)
+
+    @classmethod
+    async def verify_password_async(
+        cls: type['Hasher'],
+        unhashed_password: str,
+        hashed_password: str,
+    ) -> bool:
+        """Verify a password against a hash on the bcrypt thread pool.
+
+        Args:
+            unhashed_password (str): The plain text password to verify.
+            hashed_password (str): The previously hashed password.
+
+        Returns:
+            bool: True if the password matches the hash, False otherwise.
+
+        Raises:
+            PasswordHashingOverloadedException: If too many hashes are
+                already pending.
+
+        """
+        return await cls._run_in_executor(
+            cls.verify_password, unhashed_password, hashed_password
+        )
+
+    @classmethod
+    async def verify_and_update_async(
+        cls: type['Hasher'],
+        unhashed_password: str,
+        hashed_password: str,
+    ) -> tuple[bool, str | None]:
+        """Verify and possibly rehash a password on the bcrypt thread pool.
+
+        Args:
+            unhashed_password (str): The plain text password to verify.
+            hashed_password (str): The previously hashed password.
+
+        Returns:
+            tuple[bool, str | None]: Whether the password matches, and a
+                replacement hash if the stored one uses outdated settings.
+
+        Raises:
+            PasswordHashingOverloadedException: If too many hashes are
+                already pending.
+
+        """
+        return await cls._run_in_executor(
+            cls.verify_and_update, unhashed_password, hashed_password
+        )
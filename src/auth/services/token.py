@@ -1,9 +1,16 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import os
+import time
 import uuid
-from calendar import timegm
-from datetime import UTC, datetime, timedelta
+from datetime import datetime
 from typing import Any
 
-from jose import JWTError, jwt
+from jose import ExpiredSignatureError, JWTError, jwt
+from pydantic_core import from_json
 
 from src.auth.dto import AccessTokenDTO
 from src.auth.exceptions import (
@@ -15,20 +22,111 @@ from src.settings import Settings
 
 settings = Settings.load()
 
+_SECRET_KEY = settings.token_settings.SECRET_KEY
+_ALGORITHM = settings.token_settings.ALGORITHM
+_ALGORITHMS = [_ALGORITHM]
+_ACCESS_TOKEN_TTL = settings.token_settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TOKEN_TTL = settings.token_settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
+
+_HMAC_DIGESTS = {
+    'HS256': hashlib.sha256,
+    'HS384': hashlib.sha384,
+    'HS512': hashlib.sha512,
+}
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    """Encode bytes as unpadded base64url, as JWT segments require.
+
+    Args:
+        data (bytes): Raw bytes to encode.
+
+    Returns:
+        bytes: Base64url-encoded bytes without trailing padding.
+
+    """
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+
+# Standard-alphabet '+', '/' and padding map to '.', which strict decoding
+# rejects
+_B64URL_TO_STD = bytes.maketrans(b'-_+/=', b'+/...')
+_JWT_SEGMENTS = 3
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    """Strictly decode unpadded base64url bytes.
+
+    Unlike ``base64.urlsafe_b64decode``, characters outside the base64url
+    alphabet are rejected instead of silently discarded.
+
+    Args:
+        data (bytes): Unpadded base64url-encoded bytes.
+
+    Returns:
+        bytes: Decoded raw bytes.
+
+    Raises:
+        ValueError: If the data is not valid base64url.
+
+    """
+    return binascii.a2b_base64(
+        data.translate(_B64URL_TO_STD) + b'=' * (-len(data) % 4),
+        strict_mode=True,
+    )
+
+
+def _uuid7() -> uuid.UUID:
+    """Generate a time-ordered version 7 UUID (RFC 9562).
+
+    The 48 most significant bits hold the UNIX time in milliseconds and the
+    remaining non-version, non-variant 74 bits are random, so consecutive
+    values sort by creation time.
+
+    Returns:
+        uuid.UUID: New version 7 UUID.
+
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(
+        os.urandom(10)
+    )
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return uuid.UUID(int=value)
+
+
+_digest = _HMAC_DIGESTS.get(_ALGORITHM)
+_signer = (
+    hmac.new(_SECRET_KEY.encode(), digestmod=_digest)
+    if _digest is not None
+    else None
+)
+_header_segment = _b64url_encode(
+    json.dumps(
+        {'alg': _ALGORITHM, 'typ': 'JWT'},
+        separators=(',', ':'),
+    ).encode()
+)
+
 
 class TokenManager:
     """Manager for creating, decoding, and validating JWT tokens."""
 
     @staticmethod
-    def _get_expiration_delta() -> datetime:
-        return datetime.now(UTC) + timedelta(
-            minutes=settings.token_settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+    def _get_expiration_timestamp() -> int:
+        return int(time.time()) + _ACCESS_TOKEN_TTL
 
     @classmethod
     def generate_access_token(cls, author_id: int) -> str:
         """Generate a JWT access token for the given author ID.
 
+        HMAC-signed tokens are assembled directly: the header segment is
+        precomputed, the fixed-shape ``{"sub", "exp"}`` payload is formatted
+        straight into bytes, and a keyed HMAC object is copied for every
+        token, so the signing key is not processed again on each call.
+        Other algorithms are delegated to jose.
+
         Args:
             author_id (int): The ID of the author for whom the token.
 
@@ -36,67 +134,144 @@ class TokenManager:
             str: Encoded JWT access token.
 
         """
-        to_encode = AccessTokenDTO(
-            sub=str(author_id), exp=cls._get_expiration_delta()
-        )
+        exp = cls._get_expiration_timestamp()
+        if _signer is not None:
+            signing_input = (
+                _header_segment
+                + b'.'
+                + _b64url_encode(b'{"sub":"%d","exp":%d}' % (author_id, exp))
+            )
+            signer = _signer.copy()
+            signer.update(signing_input)
+            return (
+                signing_input + b'.' + _b64url_encode(signer.digest())
+            ).decode()
+        to_encode = AccessTokenDTO(sub=str(author_id), exp=exp)
         encoded_jwt: str = jwt.encode(
             to_encode.to_dict(),
-            settings.token_settings.SECRET_KEY,
-            algorithm=settings.token_settings.ALGORITHM,
+            _SECRET_KEY,
+            algorithm=_ALGORITHM,
         )
         return encoded_jwt
 
     @classmethod
-    def generate_refresh_token(cls) -> tuple[uuid.UUID, timedelta]:
-        """Generate a new refresh token UUID and its expiration timedelta.
+    def generate_refresh_token(cls) -> tuple[uuid.UUID, int]:
+        """Generate a new refresh token UUID and its lifetime.
 
         Returns:
-            tuple[uuid.UUID, timedelta]: Refresh token and its expiration.
+            tuple[uuid.UUID, int]: Refresh token and its lifetime in
+                seconds.
 
         """
-        return uuid.uuid4(), timedelta(
-            days=settings.token_settings.REFRESH_TOKEN_EXPIRE_DAYS
-        )
+        return _uuid7(), _REFRESH_TOKEN_TTL
 
     @classmethod
-    def decode_access_token(cls, token: str) -> dict[str, str | int]:
+    def decode_access_token(
+        cls, token: str, now: float | None = None
+    ) -> dict[str, str | int]:
         """Decode a JWT access token to retrieve its payload.
 
+        Tokens in the shape this manager issues are verified directly with
+        the precomputed HMAC signer; anything else is delegated to jose.
+
         Args:
             token (str): JWT access token.
+            now (float | None): Current UNIX timestamp, read from the clock
+                if not given.
 
         Returns:
             dict[str, str | int]: Decoded token payload.
 
         Raises:
             WrongCredentialsException: If a token is invalid can't be decoded.
+            AccessTokenExpiredException: If a validly signed token has
+                expired.
 
         """
+        if _signer is not None:
+            claims = cls._decode_hmac_token(token, now)
+            if claims is not None:
+                return claims
         try:
             decoded_jwt: dict[str, str | int] = jwt.decode(
                 token=token,
-                key=settings.token_settings.SECRET_KEY,
-                algorithms=settings.token_settings.ALGORITHM,
+                key=_SECRET_KEY,
+                algorithms=_ALGORITHMS,
             )
+        except ExpiredSignatureError:
+            raise AccessTokenExpiredException from None
         except JWTError:
             raise WrongCredentialsException from None
         return decoded_jwt
 
+    @staticmethod
+    def _decode_hmac_token(
+        token: str, now: float | None = None
+    ) -> dict[str, str | int] | None:
+        """Verify and decode a token issued by this manager's HMAC path.
+
+        Args:
+            token (str): JWT access token.
+            now (float | None): Current UNIX timestamp, read from the clock
+                if not given.
+
+        Returns:
+            dict[str, str | int] | None: Decoded payload, or None if the
+                token does not use the issued header or carries claims
+                other than ``sub`` and ``exp``, leaving it to jose.
+
+        Raises:
+            WrongCredentialsException: If the signature does not match or
+                the token is malformed.
+            AccessTokenExpiredException: If the token has expired.
+
+        """
+        segments = token.encode().split(b'.')
+        if _signer is None or segments[0] != _header_segment:
+            return None
+        if len(segments) != _JWT_SEGMENTS:
+            raise WrongCredentialsException
+        header_segment, payload_segment, signature_segment = segments
+        signer = _signer.copy()
+        signer.update(header_segment + b'.' + payload_segment)
+        # Comparing encoded signatures rejects junk and non-canonical
+        # encodings that a lenient decoder would accept
+        if not hmac.compare_digest(
+            _b64url_encode(signer.digest()), signature_segment
+        ):
+            raise WrongCredentialsException
+        try:
+            claims = from_json(_b64url_decode(payload_segment))
+        except ValueError:
+            raise WrongCredentialsException from None
+        if (
+            not isinstance(claims, dict)
+            or claims.keys() - {'sub', 'exp'}
+            or not isinstance(claims.get('sub'), str)
+            or type(claims.get('exp')) is not int
+        ):
+            return None
+        if claims['exp'] < int(time.time() if now is None else now):
+            raise AccessTokenExpiredException
+        return claims
+
     @classmethod
     def validate_access_token_expired(
-        cls, decoded: dict[str, str | int]
+        cls, decoded: dict[str, str | int], now: float | None = None
     ) -> None:
         """Validate whether a decoded JWT access token has expired.
 
         Args:
             decoded (dict[str, str | int]): Decoded JWT token payload.
+            now (float | None): Current UNIX timestamp, read from the clock
+                if not given.
 
         Raises:
             AccessTokenExpiredException: If the token is expired.
 
         """
         jwt_exp_date: int = int(decoded.get('exp', 0))
-        current_time: int = timegm(datetime.now(UTC).utctimetuple())
+        current_time = int(time.time() if now is None else now)
         if not jwt_exp_date or current_time >= jwt_exp_date:
             raise AccessTokenExpiredException
 
@@ -113,9 +288,9 @@ class TokenManager:
             RefreshTokenException: If the refresh token is expired.
 
         """
-        current_date: datetime = datetime.now(UTC)
-        refresh_token_expire_date: datetime = refresh_token_model[
-            'created_at'
-        ] + timedelta(seconds=refresh_token_model['expires_in'])
-        if current_date >= refresh_token_expire_date:
+        created_at: datetime = refresh_token_model['created_at']
+        if (
+            time.time() - created_at.timestamp()
+            >= refresh_token_model['expires_in']
+        ):
             raise RefreshTokenException
@@ -24,6 +24,17 @@ class BadPasswordSchemaException(AuthorException):
         )
 
 
+class BadEmailSchemaException(AuthorException):
+    """Raised when the email address has an invalid format."""
+
+    def __init__(self) -> None:
+        """Initialize BadEmailSchemaException with status code 422."""
+        super().__init__(
+            status_code=422,
+            detail='Email should be a valid email address.',
+        )
+
+
 class AuthorNotFoundByIdException(AuthorException):
     """Raised when an author with the specified ID does not exist."""
 
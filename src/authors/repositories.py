@@ -1,11 +1,36 @@
 from typing import Any, cast
 
-from sqlalchemy import text
+from sqlalchemy import Table, TextClause, insert, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.authors.models import Author
+from src.base.exceptions import (
+    ColumnNotAllowedException,
+    NoFieldsForUpdateException,
+)
 from src.base.query_builder import SecureQueryBuilder
 from src.base.repositories import BaseRepository
 
+_authors = cast(Table, Author.__table__)
+_INSERT_STATEMENT = insert(_authors).returning(_authors.c.id)
+_SELECT_SQL = (
+    'SELECT id, email, name, biography, birth_year, '
+    'nationality, created_at, password '
+    'FROM authors '
+)
+# Authors are only ever looked up by a single unique column.
+_SELECT_STATEMENTS: dict[frozenset[str], TextClause] = {
+    frozenset({'id'}): text(_SELECT_SQL + 'WHERE id = :id LIMIT 1'),
+    frozenset({'email'}): text(_SELECT_SQL + 'WHERE email = :email LIMIT 1'),
+}
+_SELECT_CREDENTIALS = text(
+    'SELECT id, password FROM authors WHERE email = :email LIMIT 1'
+)
+# Update statements built from validated columns, keyed by SET/WHERE columns
+_UPDATE_STATEMENTS: dict[
+    tuple[tuple[str, ...], tuple[str, ...]], TextClause
+] = {}
+
 
 class AuthorRepository(BaseRepository):
     """Repository for performing CRUD operations on the `authors` table.
@@ -14,6 +39,8 @@ class AuthorRepository(BaseRepository):
     create, retrieve, update, and delete author records.
     """
 
+    __slots__ = ()
+
     def __init__(self, session: AsyncSession):
         """Initialize the repository with a database session.
 
@@ -35,18 +62,10 @@ class AuthorRepository(BaseRepository):
             int: ID of the newly created author.
 
         """
-        sql = text(
-            """
-            INSERT INTO authors (email, password, name, biography,
-                                 birth_year, nationality, created_at)
-            VALUES (:email, :password, :name, :biography, :birth_year,
-                    :nationality, :created_at)
-            RETURNING id
-            """
-        )
-        async with self._session.begin():
-            result = await self._session.execute(sql, params)
-            return cast(int, result.scalar_one())
+        result = await self._session.execute(_INSERT_STATEMENT, params)
+        object_id = cast(int, result.scalar_one())
+        await self._session.commit()
+        return object_id
 
     async def get_object(self, **filters: Any) -> dict[str, Any] | None:
         """Retrieve a single author record matching the given filters.
@@ -58,30 +77,41 @@ class AuthorRepository(BaseRepository):
             dict[str, Any] | None: Dictionary of author fields if found,
             otherwise None.
 
+        Raises:
+            ColumnNotAllowedException: If filtering by anything other than
+                exactly one of ``id`` or ``email``.
+
         """
         if not filters:
             return None
 
-        # Build safe WHERE clause using SecureQueryBuilder
-        conditions = [(key, '=', key) for key in filters]
-        where_clause, safe_params = SecureQueryBuilder.build_where_clause(
-            'authors', conditions, filters
-        )
+        sql = _SELECT_STATEMENTS.get(frozenset(filters))
+        if sql is None:
+            raise ColumnNotAllowedException(
+                ', '.join(sorted(filters)), 'authors'
+            )
+        result = await self._session.execute(sql, filters)
+        row = result.mappings().first()
+        return dict(row) if row else None
 
-        sql = text(
-            'SELECT id, email, name, biography, birth_year, '
-            'nationality, created_at, password '
-            'FROM authors '
-            'WHERE ' + where_clause + ' '
-            'LIMIT 1'
-        )
+    async def get_auth_credentials(self, email: str) -> dict[str, Any] | None:
+        """Retrieve only the fields needed to authenticate an author.
+
+        Args:
+            email (str): Author's email.
+
+        Returns:
+            dict[str, Any] | None: Author ``id`` and hashed ``password`` if
+            found, otherwise None.
 
-        async with self._session.begin():
-            result = await self._session.execute(sql, safe_params)
-            row = result.mappings().first()
-            return dict(row) if row else None
+        """
+        result = await self._session.execute(
+            _SELECT_CREDENTIALS, {'email': email}
+        )
+        row = result.mappings().first()
+        return dict(row) if row else None
 
-    async def delete_object(self, **filters: Any) -> None:
+    async def delete_object(self, **filters: Any) -> int:
         """Delete authors is not implemented.
 
         Raises:
@@ -95,14 +125,44 @@ class AuthorRepository(BaseRepository):
         update_data: dict[str, Any],
         **filters: Any,
     ) -> dict[str, Any] | None:
-        """Update authors is not implemented.
+        """Update fields of an author matching the filters.
 
         Args:
             update_data (dict[str, Any]): Fields to update.
-            **filters (Any): Filter criteria.
+            **filters (Any): Column-value filters to identify the author.
+
+        Returns:
+            dict[str, Any] | None: Updated author data if found, or None if
+            not found or no filters are given.
 
         Raises:
-            NotImplementedError: Always raised.
+            NoFieldsForUpdateException: If no update data is provided.
 
         """
-        raise NotImplementedError
+        if not update_data:
+            raise NoFieldsForUpdateException
+        if not filters:
+            return None
+
+        set_params = SecureQueryBuilder.build_set_params(update_data)
+        key = (tuple(update_data), tuple(filters))
+        sql = _UPDATE_STATEMENTS.get(key)
+        if sql is None:
+            set_clause, _ = SecureQueryBuilder.build_set_clause(
+                'authors', list(update_data), set_params
+            )
+            where_conditions = [(column, '=', column) for column in filters]
+            where_clause, _ = SecureQueryBuilder.build_where_clause(
+                'authors', where_conditions, filters
+            )
+            sql = _UPDATE_STATEMENTS[key] = text(
+                'UPDATE authors '
+                'SET ' + set_clause + ' '
+                'WHERE ' + where_clause + ' '
+                'RETURNING id, email, name, biography, birth_year, '
+                'nationality, created_at, password'
+            )
+        result = await self._session.execute(sql, {**set_params, **filters})
+        row = result.mappings().first()
+        await self._session.commit()
+        return dict(row) if row else None
@@ -2,6 +2,8 @@
 
 from typing import Any
 
+from src.authors.schemas import CreateAuthorResponseSchema
+
 # Common responses
 VALIDATION_ERROR_RESPONSE: dict[int | str, dict[str, Any]] = {
     422: {
@@ -27,6 +29,7 @@ VALIDATION_ERROR_RESPONSE: dict[int | str, dict[str, Any]] = {
 CREATE_AUTHOR_RESPONSES: dict[int | str, dict[str, Any]] = {
     201: {
         'description': 'Author successfully created',
+        'model': CreateAuthorResponseSchema,
         'content': {'application/json': {'example': {'id': 1}}},
     },
     400: {
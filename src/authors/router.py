@@ -3,12 +3,14 @@ from typing import Annotated
 from fastapi import APIRouter, Depends
 
 from src.authors.responses import CREATE_AUTHOR_RESPONSES
-from src.authors.schemas import (
-    CreateAuthorRequestSchema,
-    CreateAuthorResponseSchema,
-)
+from src.authors.schemas import CreateAuthorRequestSchema
 from src.authors.service import AuthorService
-from src.base.dependencies import get_service
+from src.base.dependencies import (
+    get_json_body,
+    get_service,
+    json_body_openapi,
+)
+from src.base.responses import PydanticJSONResponse
 
 author_router = APIRouter(prefix='/author', tags=['author'])
 
@@ -21,11 +23,15 @@ author_router = APIRouter(prefix='/author', tags=['author'])
     ),
     status_code=201,
     responses=CREATE_AUTHOR_RESPONSES,
+    openapi_extra=json_body_openapi(CreateAuthorRequestSchema),
 )
 async def create_author(
-    author_schema: CreateAuthorRequestSchema,
+    author_schema: Annotated[
+        CreateAuthorRequestSchema,
+        Depends(get_json_body(CreateAuthorRequestSchema)),
+    ],
     service: Annotated[AuthorService, Depends(get_service(AuthorService))],
-) -> CreateAuthorResponseSchema:
+) -> PydanticJSONResponse:
     """Create a new author in the system.
 
     This endpoint accepts author details such as email, password, and name,
@@ -38,9 +44,8 @@ async def create_author(
             injection to handle business logic.
 
     Returns:
-        CreateAuthorResponseSchema: Response schema containing the ID
-        of the newly created author.
+        PydanticJSONResponse: ID of the newly created author.
 
     """
     author_id = await service.create_author(author_schema)
-    return CreateAuthorResponseSchema(id=author_id)
+    return PydanticJSONResponse({'id': author_id}, status_code=201)
@@ -1,5 +1,3 @@
-from datetime import UTC
-from datetime import datetime as dt
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -18,6 +16,8 @@ class AuthorService(BaseService):
     information by ID.
     """
 
+    __slots__ = ()
+
     def __init__(self, db_session: AsyncSession) -> None:
         """Initialize AuthorService with a database session.
 
@@ -41,7 +41,8 @@ class AuthorService(BaseService):
             dict[str, Any]: Dictionary containing author fields.
 
         """
-        author_data = await self._repo.get_object(id=int(user_id))
+        author_id = user_id if type(user_id) is int else int(user_id)
+        author_data = await self._repo.get_object(id=author_id)
         if not author_data:
             raise AuthorNotFoundByIdException
         return author_data
@@ -51,19 +52,30 @@ class AuthorService(BaseService):
     ) -> int:
         """Create a new author in the system.
 
-        The password is hashed before storing in the database, and
-        creation timestamp is set.
+        The password is hashed on the bcrypt thread pool before storing
+        in the database. The creation timestamp is set by the database.
 
         Args:
             author_schema (CreateAuthorRequestSchema): Schema containing
                 the details of the author to create.
 
+        Raises:
+            PasswordHashingOverloadedException: If too many password hashes
+                are already pending.
+
         Returns:
             int: ID of the newly created author.
 
         """
-        author_data = author_schema.model_dump()
-        author_data['password'] = Hasher.hash_password(author_schema.password)
-        author_data['created_at'] = dt.now(UTC)
+        author_data = {
+            'email': author_schema.email,
+            'password': await Hasher.hash_password_async(
+                author_schema.password
+            ),
+            'name': author_schema.name,
+            'biography': author_schema.biography,
+            'birth_year': author_schema.birth_year,
+            'nationality': author_schema.nationality,
+        }
         author_id: int = await self._repo.create_object(author_data)
         return author_id
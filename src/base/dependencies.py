@@ -1,7 +1,10 @@
-from collections.abc import Callable
-from typing import Annotated, TypeVar
+from collections.abc import Callable, Coroutine
+from functools import cache
+from typing import Annotated, Any, TypeVar
 
-from fastapi import Depends
+from fastapi import Depends, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.base.services import BaseService
@@ -10,26 +13,34 @@ from src.database import get_db
 Service = TypeVar('Service', bound=BaseService)
 
 
+@cache
 def get_service[Service](
     service_type: type[Service],
-) -> Callable[[AsyncSession], Service]:
+) -> Callable[[AsyncSession], Coroutine[Any, Any, Service]]:
     """Dependency factory to provide a service instance for FastAPI routes.
 
     This function returns a callable that FastAPI can use with Depends().
     It automatically injects an AsyncSession from the database into the
-    service constructor.
+    service constructor. Factories are memoized per service type, so every
+    ``Depends(get_service(X))`` shares one dependency callable and FastAPI
+    resolves the service once per request. The returned callable is a
+    coroutine function, so FastAPI runs it on the event loop instead of
+    dispatching it to the threadpool.
 
     Args:
         service_type (type[Service]): The class of the service to instantiate.
             Must inherit from BaseService.
 
     Returns:
-        Callable[[AsyncSession], Service]: A callable suitable for FastAPI
-        Depends that returns an instance of the requested service.
+        Callable[[AsyncSession], Coroutine[Any, Any, Service]]: A callable
+        suitable for FastAPI Depends that returns an instance of the
+        requested service.
 
     """
 
-    def _get_service(db: Annotated[AsyncSession, Depends(get_db)]) -> Service:
+    async def _get_service(
+        db: Annotated[AsyncSession, Depends(get_db)],
+    ) -> Service:
         """Inner function to instantiate the service with a database session.
 
         Args:
@@ -42,3 +53,78 @@ def get_service[Service](
         return service_type(db_session=db)  # type: ignore
 
     return _get_service
+
+
+@cache
+def get_json_body[Schema: BaseModel](
+    schema_type: type[Schema],
+) -> Callable[[Request], Coroutine[Any, Any, Schema]]:
+    """Dependency factory that validates a JSON request body from bytes.
+
+    FastAPI decodes a JSON body into Python objects before pydantic walks
+    them. The returned dependency instead hands the raw body to
+    pydantic-core, which parses and validates it in a single pass.
+    Validation errors are reported like FastAPI's own, with locations
+    prefixed by ``body``. Factories are memoized per schema type.
+
+    Routes using it should pass ``json_body_openapi(schema_type)`` as
+    ``openapi_extra`` to keep the request body documented.
+
+    Args:
+        schema_type (type[Schema]): Pydantic model describing the body.
+
+    Returns:
+        Callable[[Request], Coroutine[Any, Any, Schema]]: A callable
+        suitable for FastAPI Depends that returns the validated body.
+
+    """
+
+    async def _get_json_body(request: Request) -> Schema:
+        """Read the request body and validate it as JSON.
+
+        Args:
+            request (Request): Incoming HTTP request.
+
+        Raises:
+            RequestValidationError: If the body is not valid JSON or does
+                not match the schema.
+
+        Returns:
+            Schema: The validated request body.
+
+        """
+        body = await request.body()
+        try:
+            return schema_type.model_validate_json(body)
+        except ValidationError as exc:
+            errors = exc.errors(include_url=False)
+            raise RequestValidationError(
+                [{**error, 'loc': ('body', *error['loc'])} for error in errors],
+                body=body,
+            ) from None
+
+    return _get_json_body
+
+
+def json_body_openapi(schema_type: type[BaseModel]) -> dict[str, Any]:
+    """Build the OpenAPI request body entry for a ``get_json_body`` route.
+
+    Args:
+        schema_type (type[BaseModel]): Pydantic model describing the body.
+
+    Returns:
+        dict[str, Any]: Value for the route's ``openapi_extra`` argument.
+
+    """
+    return {
+        'requestBody': {
+            'required': True,
+            'content': {
+                'application/json': {
+                    'schema': schema_type.model_json_schema(
+                        ref_template='#/components/schemas/{model}'
+                    ),
+                },
+            },
+        },
+    }
@@ -1,21 +1,33 @@
-from dataclasses import asdict, dataclass
-from typing import Any
+import dataclasses
+from typing import Any, ClassVar
 
 
-@dataclass
 class BaseDTO:
     """Base Data Transfer Object (DTO) class.
 
     Provides a helper method to convert the dataclass to a dictionary.
-    All DTOs should inherit from this class.
+    All DTOs should inherit from this class and be declared as dataclasses.
+    The base declares no fields and empty ``__slots__``, so subclasses may
+    be frozen and/or slotted dataclasses.
     """
 
+    __slots__ = ()
+    # Set by @dataclass on subclasses; declared so type checkers accept
+    # DTOs wherever a dataclass instance is expected.
+    __dataclass_fields__: ClassVar[dict[str, dataclasses.Field[Any]]]
+
     def to_dict(self) -> dict[str, Any]:
         """Convert the DTO instance to a dictionary.
 
+        Unlike ``dataclasses.asdict``, field values are not deep-copied,
+        so mutable values are shared with the DTO.
+
         Returns:
             dict[str, Any]: Dictionary representation of the DTO, where keys
             are field names and values are field values.
 
         """
-        return asdict(self)
+        return {
+            field.name: getattr(self, field.name)
+            for field in dataclasses.fields(self)
+        }
@@ -2,7 +2,7 @@ import logging
 import uuid
 from datetime import UTC, datetime
 
-from fastapi import HTTPException, Request
+from fastapi import HTTPException
 from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.types import ASGIApp, Receive, Scope, Send
@@ -10,6 +10,31 @@ from starlette.types import ASGIApp, Receive, Scope, Send
 logger = logging.getLogger(__name__)
 
 
+class _LazyRequestId:
+    """Request ID that is only generated when it is first read.
+
+    Most requests never need their ID, so the UUID is not created until
+    the object is converted to a string.
+    """
+
+    __slots__ = ('_value',)
+
+    def __init__(self) -> None:
+        """Initialize the request ID without generating it."""
+        self._value: str | None = None
+
+    def __str__(self) -> str:
+        """Return the request ID, generating it on first access.
+
+        Returns:
+            str: Hex representation of a random UUID.
+
+        """
+        if self._value is None:
+            self._value = uuid.uuid4().hex
+        return self._value
+
+
 class GlobalExceptionMiddleware:
     """ASGI middleware for handling uncaught exceptions globally in FastAPI.
 
@@ -46,7 +71,7 @@ class GlobalExceptionMiddleware:
                 handled by default handlers.
 
         Behavior:
-            - Generates a unique request ID for each request.
+            - Attaches a lazily generated request ID to each request.
             - Logs unexpected exceptions with request ID.
             - Returns a JSON response with status 500 for unhandled exceptions,
               including a timestamp and the request ID.
@@ -56,8 +81,7 @@ class GlobalExceptionMiddleware:
             await self.app(scope, receive, send)
             return
 
-        Request(scope, receive=receive)
-        request_id: str = str(uuid.uuid4())
+        request_id = _LazyRequestId()
         scope.setdefault('state', {})
         scope['state']['request_id'] = request_id
 
@@ -76,7 +100,7 @@ class GlobalExceptionMiddleware:
                     'code': 'INTERNAL_SERVER_ERROR',
                     'message': 'An unexpected error occurred. '
                     'Please try again later.',
-                    'request_id': request_id,
+                    'request_id': str(request_id),
                     'timestamp': now,
                 },
             )
@@ -15,7 +15,7 @@ class TimeStampMixin(Base):
 
     Attributes:
         created_at (Mapped[datetime]): Timestamp when the record was created.
-            Defaults to the current database time.
+            Set by the database when omitted from the insert.
         updated_at (Mapped[datetime]): Timestamp when the record was last
             updated. Automatically updated on any record modification.
 
@@ -25,7 +25,7 @@ class TimeStampMixin(Base):
 
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
-        default=func.now(),
+        server_default=func.now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
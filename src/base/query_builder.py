@@ -4,6 +4,7 @@ This module provides a safe way to build dynamic SQL queries
 without risk of SQL injection attacks.
 """
 
+import sys
 from typing import Any, ClassVar
 
 from src.base.exceptions import (
@@ -22,47 +23,74 @@ class SecureQueryBuilder:
     WHERE clauses and other conditions without risk of SQL injection.
     """
 
+    __slots__ = ()
+
     # Whitelist of allowed column names for each table
-    ALLOWED_COLUMNS: ClassVar[dict[str, set[str]]] = {
-        'books': {
-            'id',
-            'title',
-            'genre',
-            'language',
-            'published_year',
-            'author_id',
-            'created_at',
-        },
-        'authors': {
-            'id',
-            'email',
-            'name',
-            'biography',
-            'birth_year',
-            'nationality',
-            'created_at',
-            'password',
-        },
-        'refresh_tokens': {
-            'id',
-            'author_id',
-            'refresh_token',
-            'expires_in',
-            'created_at',
-        },
+    ALLOWED_COLUMNS: ClassVar[dict[str, frozenset[str]]] = {
+        'books': frozenset(
+            {
+                'id',
+                'title',
+                'genre',
+                'language',
+                'published_year',
+                'author_id',
+                'created_at',
+            }
+        ),
+        'authors': frozenset(
+            {
+                'id',
+                'email',
+                'name',
+                'biography',
+                'birth_year',
+                'nationality',
+                'created_at',
+                'password',
+            }
+        ),
+        'refresh_tokens': frozenset(
+            {
+                'id',
+                'author_id',
+                'refresh_token',
+                'expires_in',
+                'created_at',
+            }
+        ),
     }
 
     # Allowed operators for WHERE conditions
-    ALLOWED_OPERATORS: ClassVar[set[str]] = {
-        '=',
-        '!=',
-        '<',
-        '>',
-        '<=',
-        '>=',
-        'LIKE',
-        'IN',
-        'NOT IN',
+    ALLOWED_OPERATORS: ClassVar[frozenset[str]] = frozenset(
+        {
+            '=',
+            '!=',
+            '<',
+            '>',
+            '<=',
+            '>=',
+            'LIKE',
+            'IN',
+            'NOT IN',
+        }
+    )
+
+    # Canonical form of each operator, also keyed by its lowercase spelling
+    _OPERATORS: ClassVar[dict[str, str]] = {
+        **{operator: operator for operator in ALLOWED_OPERATORS},
+        **{operator.lower(): operator for operator in ALLOWED_OPERATORS},
+    }
+
+    # Validated WHERE fragments keyed by (table, column, operator, param)
+    _FRAGMENT_CACHE: ClassVar[dict[tuple[str, str, str, str], str]] = {}
+    _FRAGMENT_CACHE_MAX_SIZE: ClassVar[int] = 1024
+
+    # Interned SET parameter names for every whitelisted column
+    _SET_PARAM_NAMES: ClassVar[dict[str, str]] = {
+        column: sys.intern(f'set_{column}')
+        for columns in ALLOWED_COLUMNS.values()
+        for column in columns
     }
 
     @classmethod
@@ -102,10 +130,44 @@ class SecureQueryBuilder:
             ValueError: If the operator is not allowed.
 
         """
-        if operator.upper() not in cls.ALLOWED_OPERATORS:
-            raise OperatorNotAllowedException(operator)
+        validated_operator = cls._OPERATORS.get(operator)
+        if validated_operator is None:
+            validated_operator = cls._OPERATORS.get(operator.upper())
+            if validated_operator is None:
+                raise OperatorNotAllowedException(operator)
+        return validated_operator
 
-        return operator.upper()
+    @classmethod
+    def validate_condition(
+        cls, table_name: str, column_name: str, operator: str
+    ) -> tuple[str, str]:
+        """Validate the column and operator of a condition in one pass.
+
+        Args:
+            table_name (str): Name of the database table.
+            column_name (str): Name of the column to validate.
+            operator (str): SQL operator to validate.
+
+        Returns:
+            tuple[str, str]: The validated column name and operator.
+
+        Raises:
+            UnknownTableException: If the table is unknown.
+            ColumnNotAllowedException: If the column is not allowed.
+            OperatorNotAllowedException: If the operator is not allowed.
+
+        """
+        columns = cls.ALLOWED_COLUMNS.get(table_name)
+        if columns is None:
+            raise UnknownTableException(table_name)
+        if column_name not in columns:
+            raise ColumnNotAllowedException(column_name, table_name)
+        validated_operator = cls._OPERATORS.get(operator)
+        if validated_operator is None:
+            validated_operator = cls._OPERATORS.get(operator.upper())
+            if validated_operator is None:
+                raise OperatorNotAllowedException(operator)
+        return column_name, validated_operator
 
     @classmethod
     def build_where_clause(
@@ -140,21 +202,82 @@ class SecureQueryBuilder:
         if not conditions:
             return 'TRUE', params
 
-        validated_conditions = []
-        for column, operator, param_name in conditions:
-            # Validate column and operator
-            validated_column = cls.validate_column(table_name, column)
-            validated_operator = cls.validate_operator(operator)
+        return ' AND '.join(
+            cls._build_condition(table_name, condition, params)
+            for condition in conditions
+        ), params
 
-            # Check that parameter exists
-            if param_name not in params:
-                raise ParameterNotFoundException(param_name)
+    @classmethod
+    def _build_condition(
+        cls,
+        table_name: str,
+        condition: tuple[str, str, str],
+        params: dict[str, Any],
+    ) -> str:
+        """Build a single validated WHERE condition.
+
+        Fragments are cached once validated, so repeated conditions skip
+        the column and operator checks.
 
-            validated_conditions.append(
-                f'{validated_column} {validated_operator} :{param_name}'
+        Args:
+            table_name (str): Name of the database table.
+            condition (tuple[str, str, str]): Column, operator and
+                parameter name.
+            params (dict[str, Any]): Parameters dictionary.
+
+        Returns:
+            str: Condition such as ``title = :title_param``.
+
+        """
+        column, operator, param_name = condition
+        key = (table_name, column, operator, param_name)
+        fragment = cls._FRAGMENT_CACHE.get(key)
+        if fragment is None:
+            validated_column, validated_operator = cls.validate_condition(
+                table_name, column, operator
             )
+            fragment = f'{validated_column} {validated_operator} :{param_name}'
+            if len(cls._FRAGMENT_CACHE) < cls._FRAGMENT_CACHE_MAX_SIZE:
+                cls._FRAGMENT_CACHE[key] = fragment
+
+        # Check that parameter exists
+        if param_name not in params:
+            raise ParameterNotFoundException(param_name)
+
+        return fragment
+
+    @classmethod
+    def set_param_name(cls, column_name: str) -> str:
+        """Return the bind parameter name used for a column in SET clauses.
+
+        Names of whitelisted columns are precomputed and interned, so the
+        parameter dicts built per request share their keys with the cached
+        statements.
+
+        Args:
+            column_name (str): Name of the column to update.
+
+        Returns:
+            str: Parameter name with the ``set_`` prefix.
+
+        """
+        return cls._SET_PARAM_NAMES.get(column_name) or f'set_{column_name}'
+
+    @classmethod
+    def build_set_params(cls, update_data: dict[str, Any]) -> dict[str, Any]:
+        """Build the SET parameters dictionary for an update.
+
+        Args:
+            update_data (dict[str, Any]): Fields and values to update.
 
-        return ' AND '.join(validated_conditions), params
+        Returns:
+            dict[str, Any]: Values keyed by their ``set_`` parameter names.
+
+        """
+        return {
+            cls.set_param_name(column): value
+            for column, value in update_data.items()
+        }
 
     @classmethod
     def build_set_clause(
@@ -174,19 +297,19 @@ class SecureQueryBuilder:
         if not update_fields:
             raise NoFieldsForUpdateException
 
+        param_names = [cls.set_param_name(field) for field in update_fields]
         validated_fields = []
-        updated_params = {}
 
-        for field in update_fields:
+        for field, param_name in zip(update_fields, param_names, strict=True):
             # Validate column
             validated_field = cls.validate_column(table_name, field)
 
             # Check that parameter exists with 'set_' prefix
-            param_name = f'set_{field}'
             if param_name not in params:
                 raise ParameterNotFoundException(param_name)
 
             validated_fields.append(f'{validated_field} = :{param_name}')
-            updated_params[param_name] = params[param_name]
 
-        return ', '.join(validated_fields), updated_params
+        return ', '.join(validated_fields), {
+            name: params[name] for name in param_names
+        }
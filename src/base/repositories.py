@@ -16,6 +16,8 @@ class BaseRepository(ABC):
 
     """
 
+    __slots__ = ('_session',)
+
     def __init__(self, session: AsyncSession):
         """Initialize the repository with a database session.
 
@@ -70,14 +72,14 @@ class BaseRepository(ABC):
         """
 
     @abstractmethod
-    async def delete_object(self, **filters: Any) -> None:
-        """Delete an object matching the given filters.
+    async def delete_object(self, **filters: Any) -> int:
+        """Delete objects matching the given filters.
 
         Args:
             **filters (Any): Keyword arguments to identify the object.
 
         Returns:
-            None
+            int: Number of deleted objects.
 
         """
 
@@ -89,6 +91,8 @@ class ListableRepository(BaseRepository):
     `list_objects`.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def list_objects(
         self,
@@ -0,0 +1,26 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """JSON response rendered by pydantic-core's Rust serializer.
+
+    Drop-in replacement for JSONResponse that encodes the content straight
+    to UTF-8 bytes instead of going through the stdlib json module. Pydantic
+    models can be passed as content directly and are serialized without an
+    intermediate dict.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialize the response content to JSON bytes.
+
+        Args:
+            content (Any): JSON-compatible content or a pydantic model.
+
+        Returns:
+            bytes: Encoded JSON body.
+
+        """
+        return to_json(content)
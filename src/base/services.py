@@ -19,6 +19,8 @@ class BaseService:
 
     """
 
+    __slots__ = ('_repo', '_session')
+
     def __init__(self, db_session: AsyncSession, repo: BaseRepository) -> None:
         """Initialize the service with a database session and repository.
 
@@ -30,6 +32,18 @@ class BaseService:
         self._session: AsyncSession = db_session
         self._repo: BaseRepository = repo
 
+    @final
+    async def release_connection(self) -> None:
+        """Return the session's pooled connection once reads are done.
+
+        Ends the implicit transaction opened by previous SELECTs so the
+        connection is not held while the rest of the request runs. The
+        session stays usable and checks out a connection again on its next
+        query.
+        """
+        if self._session.in_transaction():
+            await self._session.commit()
+
     @staticmethod
     @final
     def _validate_schema_for_update_request(
@@ -50,10 +64,15 @@ class BaseService:
             ForgottenParametersException: If the schema has no fields to update.
 
         """
-        schema_fields: dict[str, str] = schema.model_dump(
-            exclude_none=True,
-            exclude_unset=True,
-        )  # Delete None key value pair
+        # Read explicitly set, non-None fields in declaration order without
+        # running the serializer over the whole model.
+        fields_set = schema.model_fields_set
+        schema_fields: dict[str, Any] = {
+            name: value
+            for name in type(schema).model_fields
+            if name in fields_set
+            and (value := getattr(schema, name)) is not None
+        }
         if not schema_fields:
             raise ForgottenParametersException
         return schema_fields
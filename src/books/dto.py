@@ -5,7 +5,7 @@ from src.base.dto import BaseDTO
 from src.books.enum import BookGenre, BookLanguage
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImportedBooksDTO(BaseDTO):
     """DTO representing the result of a bulk book import.
 
@@ -19,7 +19,7 @@ class ImportedBooksDTO(BaseDTO):
     book_ids: list[int]
 
 
-@dataclass
+@dataclass(slots=True)
 class GetBooksParamsResponseDTO(BaseDTO):
     """DTO for filtering and pagination parameters when retrieving books.
 
@@ -47,7 +47,7 @@ class GetBooksParamsResponseDTO(BaseDTO):
     year_to: int | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GetBooksResponseDTO(BaseDTO):
     """DTO for the response when retrieving multiple books.
 
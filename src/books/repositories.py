@@ -1,6 +1,6 @@
 from typing import Any, cast
 
-from sqlalchemy import text
+from sqlalchemy import CursorResult, Table, TextClause, insert, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.base.query_builder import SecureQueryBuilder
@@ -10,6 +10,13 @@ from src.books.exceptions import (
     NoUpdateDataException,
     UnsafeFilterException,
 )
+from src.books.models import Book
+
+_books = cast(Table, Book.__table__)
+# Statements built from validated columns, keyed by operation and columns
+_STATEMENT_CACHE: dict[
+    tuple[str, tuple[str, ...], tuple[str, ...]], TextClause
+] = {}
 
 
 class BookRepository(ListableRepository):
@@ -23,6 +30,8 @@ class BookRepository(ListableRepository):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, session: AsyncSession):
         """Initialize the repository with a database session.
 
@@ -52,9 +61,33 @@ class BookRepository(ListableRepository):
             RETURNING id
             """
         )
-        async with self._session.begin():
-            result = await self._session.execute(sql, params)
-            return cast(int, result.scalar_one())
+        result = await self._session.execute(sql, params)
+        object_id = cast(int, result.scalar_one())
+        await self._session.commit()
+        return object_id
+
+    async def create_objects(
+        self, params_list: list[dict[str, Any]]
+    ) -> list[int]:
+        """Insert several books with a single batched statement.
+
+        Args:
+            params_list (list[dict[str, Any]]): Book fields for each book,
+                as accepted by `create_object`.
+
+        Returns:
+            list[int]: IDs of the created books, in input order.
+
+        """
+        if not params_list:
+            return []
+        sql = insert(_books).returning(
+            _books.c.id, sort_by_parameter_order=True
+        )
+        result = await self._session.execute(sql, params_list)
+        book_ids = list(result.scalars().all())
+        await self._session.commit()
+        return book_ids
 
     async def get_object(self, **filters: Any) -> dict[str, Any] | None:
         """Retrieve a single book matching the given filters.
@@ -69,24 +102,25 @@ class BookRepository(ListableRepository):
         if not filters:
             return None
 
-        # Build safe WHERE clause using SecureQueryBuilder
-        conditions = [(key, '=', key) for key in filters]
-        where_clause, safe_params = SecureQueryBuilder.build_where_clause(
-            'books', conditions, filters
-        )
-
-        sql = text(
-            'SELECT id, title, genre, language, published_year, '
-            'author_id, created_at '
-            'FROM books '
-            'WHERE ' + where_clause + ' '
-            'LIMIT 1'
-        )
-
-        async with self._session.begin():
-            result = await self._session.execute(sql, safe_params)
-            row = result.mappings().first()
-            return dict(row) if row else None
+        key = ('select', tuple(filters), ())
+        sql = _STATEMENT_CACHE.get(key)
+        if sql is None:
+            # Build safe WHERE clause using SecureQueryBuilder
+            conditions = [(column, '=', column) for column in filters]
+            where_clause, _ = SecureQueryBuilder.build_where_clause(
+                'books', conditions, filters
+            )
+            sql = _STATEMENT_CACHE[key] = text(
+                'SELECT id, title, genre, language, published_year, '
+                'author_id, created_at '
+                'FROM books '
+                'WHERE ' + where_clause + ' '
+                'LIMIT 1'
+            )
+
+        result = await self._session.execute(sql, filters)
+        row = result.mappings().first()
+        return dict(row) if row else None
 
     async def update_object(
         self,
@@ -108,54 +142,65 @@ class BookRepository(ListableRepository):
         if not filters:
             raise NoFiltersException
 
-        # Build safe SET clause
-        set_clause, set_params = SecureQueryBuilder.build_set_clause(
-            'books',
-            list(update_data.keys()),
-            {f'set_{k}': v for k, v in update_data.items()},
-        )
-
-        # Build safe WHERE clause
-        where_conditions = [(key, '=', key) for key in filters]
-        where_clause, where_params = SecureQueryBuilder.build_where_clause(
-            'books', where_conditions, filters
-        )
+        set_params = SecureQueryBuilder.build_set_params(update_data)
+        key = ('update', tuple(update_data), tuple(filters))
+        sql = _STATEMENT_CACHE.get(key)
+        if sql is None:
+            # Build safe SET clause
+            set_clause, _ = SecureQueryBuilder.build_set_clause(
+                'books', list(update_data), set_params
+            )
+
+            # Build safe WHERE clause
+            where_conditions = [(column, '=', column) for column in filters]
+            where_clause, _ = SecureQueryBuilder.build_where_clause(
+                'books', where_conditions, filters
+            )
+
+            sql = _STATEMENT_CACHE[key] = text(
+                'UPDATE books '
+                'SET ' + set_clause + ' '
+                'WHERE ' + where_clause + ' '
+                'RETURNING *'
+            )
 
         # Combine parameters
-        params = {**set_params, **where_params}
-
-        sql = text(
-            'UPDATE books '
-            'SET ' + set_clause + ' '
-            'WHERE ' + where_clause + ' '
-            'RETURNING *'
-        )
-        async with self._session.begin():
-            result = await self._session.execute(sql, params)
-            row = result.mappings().first()
-            return dict(row) if row else None
+        params = {**set_params, **filters}
+        result = await self._session.execute(sql, params)
+        row = result.mappings().first()
+        await self._session.commit()
+        return dict(row) if row else None
 
-    async def delete_object(self, **filters: Any) -> None:
-        """Delete a book matching the given filters.
+    async def delete_object(self, **filters: Any) -> int:
+        """Delete books matching the given filters.
 
         Args:
             **filters (Any): Column-value filters to identify the book.
 
+        Returns:
+            int: Number of deleted books.
+
         """
         if not filters:
             raise NoFiltersException
 
-        # Build safe WHERE clause
-        where_conditions = [(key, '=', key) for key in filters]
-        where_clause, safe_params = SecureQueryBuilder.build_where_clause(
-            'books', where_conditions, filters
-        )
-
-        # where_clause is validated by SecureQueryBuilder, so this is safe
-        sql = text('DELETE FROM books WHERE ' + where_clause)  # noqa: S608
-
-        async with self._session.begin():
-            await self._session.execute(sql, safe_params)
+        key = ('delete', tuple(filters), ())
+        sql = _STATEMENT_CACHE.get(key)
+        if sql is None:
+            # Build safe WHERE clause
+            where_conditions = [(column, '=', column) for column in filters]
+            where_clause, _ = SecureQueryBuilder.build_where_clause(
+                'books', where_conditions, filters
+            )
+
+            # where_clause is validated by SecureQueryBuilder, so this is safe
+            sql = _STATEMENT_CACHE[key] = text(
+                'DELETE FROM books WHERE ' + where_clause  # noqa: S608
+            )
+
+        result = await self._session.execute(sql, filters)
+        await self._session.commit()
+        return cast(CursorResult[Any], result).rowcount
 
     async def list_objects(
         self,
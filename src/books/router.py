@@ -3,7 +3,11 @@ from typing import Annotated, Any
 from fastapi import APIRouter, Depends, File, Path, Query, UploadFile
 
 from src.auth.dependencies import get_author_from_token
-from src.base.dependencies import get_service
+from src.base.dependencies import (
+    get_json_body,
+    get_service,
+    json_body_openapi,
+)
 from src.books.responses import (
     CREATE_BOOK_RESPONSES,
     DELETE_BOOK_RESPONSES,
@@ -71,10 +75,14 @@ async def get_all_books(
     description='Create a new book by the authenticated author.',
     status_code=201,
     responses=CREATE_BOOK_RESPONSES,
+    openapi_extra=json_body_openapi(CreateBookRequestSchema),
 )
 async def create_book(
     author: Annotated[dict[str, Any], Depends(get_author_from_token)],
-    book_schema: CreateBookRequestSchema,
+    book_schema: Annotated[
+        CreateBookRequestSchema,
+        Depends(get_json_body(CreateBookRequestSchema)),
+    ],
     service: Annotated[BooksService, Depends(get_service(BooksService))],
 ) -> CreateBookResponseSchema:
     """Create a new book in the system.
@@ -126,10 +134,14 @@ async def get_book(
     summary='Update a book',
     description='Update details of a book by its author.',
     responses=UPDATE_BOOK_RESPONSES,
+    openapi_extra=json_body_openapi(UpdateBookRequestSchema),
 )
 async def update_book(
     author: Annotated[dict[str, Any], Depends(get_author_from_token)],
-    update_book_schema: UpdateBookRequestSchema,
+    update_book_schema: Annotated[
+        UpdateBookRequestSchema,
+        Depends(get_json_body(UpdateBookRequestSchema)),
+    ],
     service: Annotated[BooksService, Depends(get_service(BooksService))],
     book_id: int = Path(
         ...,
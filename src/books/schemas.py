@@ -7,6 +7,8 @@ from pydantic import Field
 from src.base.schemas import BaseSchema
 from src.books.enum import BookGenre, BookLanguage
 
+_CURRENT_YEAR = dt.now(UTC).year
+
 
 class CreateBookRequestSchema(BaseSchema):
     """Schema for creating a new book.
@@ -54,7 +56,7 @@ class CreateBookRequestSchema(BaseSchema):
         int,
         Field(
             ge=1800,
-            le=dt.now(UTC).year,
+            le=_CURRENT_YEAR,
             example=1985,
             description='Book published year',
         ),
@@ -104,7 +106,7 @@ class UpdateBookRequestSchema(BaseSchema):
         Field(
             default=None,
             ge=1800,
-            le=dt.now(UTC).year,
+            le=_CURRENT_YEAR,
             example=1985,
             description='Book published year',
         ),
@@ -195,7 +197,7 @@ class BookFiltersSchema(BaseSchema):
         Field(
             default=None,
             ge=1800,
-            le=dt.now(UTC).year,
+            le=_CURRENT_YEAR,
             description='Filter by published year',
             examples=[1985, 2022],
         ),
@@ -205,7 +207,7 @@ class BookFiltersSchema(BaseSchema):
         Field(
             default=None,
             ge=1800,
-            le=dt.now(UTC).year,
+            le=_CURRENT_YEAR,
             description='Filter books published from this year (inclusive)',
         ),
     ] = None
@@ -214,7 +216,7 @@ class BookFiltersSchema(BaseSchema):
         Field(
             default=None,
             ge=1800,
-            le=dt.now(UTC).year,
+            le=_CURRENT_YEAR,
             description='Filter books published up to this year (inclusive)',
         ),
     ] = None
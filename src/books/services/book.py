@@ -34,6 +34,10 @@ class BooksService(BaseService):
 
     """
 
+    __slots__ = ()
+
+    _repo: BookRepository
+
     def __init__(
         self,
         db_session: AsyncSession,
@@ -217,7 +221,7 @@ class BooksService(BaseService):
         if params.filters.year_to is not None:
             filters.append('published_year <= :year_to')
             params_d.year_to = params.filters.year_to
-        rows = await self._repo.list_objects(filters, params_d.to_dict())  # type: ignore
+        rows = await self._repo.list_objects(filters, params_d.to_dict())
         items = rows[: params.limit]
         next_cursor = items[-1]['id'] if len(rows) > params.limit else None
         return GetBooksResponseDTO(items=items, next_cursor=next_cursor)
@@ -237,11 +241,11 @@ class BooksService(BaseService):
         """
         importer = BookImporterFactory.get_importer(file)
         books_to_create = await importer.parse(file)
-        created_ids: list[int] = []
-        for f_book_data in books_to_create:
-            book_data = self._format_book_data(
+        books_data = [
+            self._format_book_data(
                 author, CreateBookRequestSchema(**f_book_data)
             )
-            book_id = await self._repo.create_object(book_data)
-            created_ids.append(book_id)
+            for f_book_data in books_to_create
+        ]
+        created_ids = await self._repo.create_objects(books_data)
         return ImportedBooksDTO(imported=len(created_ids), book_ids=created_ids)
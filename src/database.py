@@ -29,6 +29,14 @@ class Base(DeclarativeBase):
 engine = create_async_engine(
     settings.database_settings.database_url,
     echo=(settings.APP_MODE == 'dev'),  # Echo only in dev mode
+    pool_size=settings.database_settings.POOL_SIZE,
+    max_overflow=settings.database_settings.MAX_OVERFLOW,
+    pool_recycle=settings.database_settings.POOL_RECYCLE_SECONDS,
+    pool_pre_ping=settings.database_settings.POOL_PRE_PING,
+    # Room for every prebuilt statement plus the dynamic book filters.
+    query_cache_size=1200,
+    # Reuse server-side prepared statements per connection.
+    connect_args={'prepared_statement_cache_size': 256},
 )
 
 async_db_session = async_sessionmaker(
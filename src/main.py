@@ -6,6 +6,7 @@ from fastapi.responses import JSONResponse
 from src.auth.router import auth_router
 from src.authors.router import author_router
 from src.base.middleware import GlobalExceptionMiddleware
+from src.base.responses import PydanticJSONResponse
 from src.books.router import books_router
 from src.logger import configure_logging
 from src.settings import Settings
@@ -26,6 +27,7 @@ app = FastAPI(
         ' Built with FastAPI, SQLAlchemy, and PostgreSQL.'
     ),
     version='1.0.0',
+    default_response_class=PydanticJSONResponse,
     contact={
         'name': 'Serhii Kryvtsun',
         'url': 'https://github.com/pitrella',
@@ -1,3 +1,4 @@
+import os
 from functools import cache
 from pathlib import Path
 
@@ -21,6 +22,18 @@ class TokenSettings(BaseSettings):
     ALGORITHM: str = 'HS256'
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    CACHE_MAX_SIZE: int = 10_000
+    CACHE_TTL_SECONDS: int = 60
+
+
+class BcryptSettings(BaseSettings):
+    """Password hashing settings."""
+
+    model_config = SettingsConfigDict(**COMMON_CONFIG, env_prefix='BCRYPT_')
+
+    WORKERS: int = Field(default_factory=lambda: (os.cpu_count() or 1) * 2)
+    MAX_PENDING: int = 500
+    ROUNDS: int = 10
 
 
 class DatabaseSettings(BaseSettings):
@@ -33,6 +46,14 @@ class DatabaseSettings(BaseSettings):
     USER: str
     PASSWORD: str
     NAME: str
+    # The pool is per worker process: each one may open up to
+    # POOL_SIZE + MAX_OVERFLOW connections, so with several workers lower
+    # these until the total stays below PostgreSQL's max_connections
+    # (100 by default).
+    POOL_SIZE: int = 50
+    MAX_OVERFLOW: int = 40
+    POOL_RECYCLE_SECONDS: int = 1800
+    POOL_PRE_PING: bool = False
 
     @property
     def database_url(self) -> str:
@@ -63,6 +84,7 @@ class Settings(BaseSettings):
     APP_MODE: str = 'dev'
     # Nested settings
     token_settings: TokenSettings = Field(default_factory=TokenSettings)
+    bcrypt_settings: BcryptSettings = Field(default_factory=BcryptSettings)
     database_settings: DatabaseSettings = Field(
         default_factory=DatabaseSettings  # type: ignore
     )
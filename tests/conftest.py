@@ -1,11 +1,12 @@
 import asyncio
 import os
 import tempfile
-from typing import AsyncGenerator, Generator
+from typing import Annotated, AsyncGenerator, Generator
 from unittest.mock import AsyncMock
 
 import pytest
 import pytest_asyncio
+from fastapi import Depends
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -77,7 +78,7 @@ async def test_client(test_session: AsyncSession) -> TestClient:
         yield test_session
     
     def override_get_service(service_type):
-        def _get_service(db: AsyncSession = test_session):
+        async def _get_service(db: Annotated[AsyncSession, Depends(get_db)]):
             return service_type(db_session=db)
         return _get_service
     
@@ -1,14 +1,23 @@
+import asyncio
+import bcrypt
 import pytest
+import time
 import uuid
-from unittest.mock import AsyncMock, patch
+from unittest.mock import ANY, AsyncMock, patch
 from datetime import datetime, timedelta, timezone
 
+from jose import jwt
+
 from src.auth.services.hasher import Hasher
-from src.auth.services.token import TokenManager
+from src.auth.services.token import TokenManager, settings
 from src.auth.services.auth import AuthService
+from src.auth.services.cache import CachingTokenValidator
 from src.auth.exceptions import WrongCredentialsException, \
-    RefreshTokenException
+    RefreshTokenException, PasswordHashingOverloadedException, \
+    AccessTokenExpiredException
 from src.auth.schemas import TokenSchemas
+from src.authors.service import AuthorService
+from src.base.dependencies import get_service
 
 
 class TestHasher:
@@ -44,7 +53,60 @@ class TestHasher:
         hashed = Hasher.hash_password(password)
 
         assert Hasher.verify_password("", hashed) is False
-        # Skip testing empty hash as it causes passlib error
+        # Skip testing empty hash as bcrypt rejects it as malformed
+
+    def test_verify_and_update_current_hash(self):
+        """Test a hash with the configured cost is not replaced."""
+        hashed = Hasher.hash_password("TestPassword123!")
+
+        assert Hasher.verify_and_update("TestPassword123!", hashed) == (
+            True, None)
+        assert Hasher.verify_and_update("Wrong1!", hashed) == (False, None)
+
+    def test_verify_and_update_legacy_variant(self):
+        """Test a $2a$ hash is verified and replaced with a $2b$ one."""
+        hashed = Hasher.hash_password("TestPassword123!")
+        legacy = "$2a$" + hashed[4:]
+
+        is_valid, new_hash = Hasher.verify_and_update(
+            "TestPassword123!", legacy)
+
+        assert is_valid is True
+        assert new_hash is not None
+        assert new_hash.startswith("$2b$")
+
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify_password_async(self):
+        """Test the thread pool variants round-trip a password."""
+        password = "TestPassword123!"
+        hashed = await Hasher.hash_password_async(password)
+
+        assert await Hasher.verify_password_async(password, hashed) is True
+        assert await Hasher.verify_password_async("Wrong1!", hashed) is False
+
+    @pytest.mark.asyncio
+    async def test_hash_password_async_rejects_when_overloaded(self):
+        """Test new hashes are rejected once too many are pending."""
+        with patch.object(Hasher, '_pending', 10 ** 6):
+            with pytest.raises(PasswordHashingOverloadedException) as exc:
+                await Hasher.hash_password_async("TestPassword123!")
+
+        assert exc.value.status_code == 503
+        assert exc.value.headers == {"Retry-After": "1"}
+
+    def test_hash_password_async_works_across_event_loops(self):
+        """Test async hashing is usable from more than one event loop."""
+        async def hash_concurrently():
+            # More calls than workers, so callers wait on the semaphore
+            return await asyncio.gather(*(
+                Hasher.hash_password_async("TestPassword123!")
+                for _ in range(settings.bcrypt_settings.WORKERS + 2)
+            ))
+
+        for _ in range(2):
+            hashes = asyncio.run(hash_concurrently())
+            assert Hasher.verify_password("TestPassword123!", hashes[0])
 
 
 class TestTokenManager:
@@ -63,6 +125,19 @@ class TestTokenManager:
         assert decoded["sub"] == str(author_id)
         assert "exp" in decoded
 
+    def test_generate_access_token_matches_jose(self):
+        """Test the HMAC fast path produces the same token as jose."""
+        with patch.object(TokenManager, '_get_expiration_timestamp',
+                          return_value=1_700_000_000):
+            token = TokenManager.generate_access_token(123)
+
+        expected = jwt.encode(
+            {"sub": "123", "exp": 1_700_000_000},
+            settings.token_settings.SECRET_KEY,
+            algorithm=settings.token_settings.ALGORITHM,
+        )
+        assert token == expected
+
     def test_generate_refresh_token(self):
         """Test refresh token generation."""
         token, delta = TokenManager.generate_refresh_token()
@@ -70,7 +145,18 @@ class TestTokenManager:
         # Token is UUID, not string
         assert hasattr(token, 'hex')  # UUID has hex attribute
         assert len(str(token)) > 0
-        assert delta.total_seconds() > 0
+        assert isinstance(delta, int)
+        assert delta > 0
+
+    def test_generate_refresh_token_is_time_ordered(self):
+        """Test refresh tokens are RFC 9562 version 7 UUIDs."""
+        first, _ = TokenManager.generate_refresh_token()
+        time.sleep(0.002)
+        second, _ = TokenManager.generate_refresh_token()
+
+        assert first.version == 7
+        assert first.variant == uuid.RFC_4122
+        assert first < second
 
     def test_decode_access_token_valid(self):
         """Test decoding valid access token."""
@@ -87,12 +173,80 @@ class TestTokenManager:
         with pytest.raises(Exception):
             TokenManager.decode_access_token("invalid.token.here")
 
+    def test_decode_access_token_tampered_signature(self):
+        """Test a token with a forged signature is rejected."""
+        token = TokenManager.generate_access_token(123)
+        header, payload, _ = token.split(".")
+        forged = jwt.encode({"sub": "1", "exp": 2 ** 31}, "wrong-key")
+
+        with pytest.raises(WrongCredentialsException):
+            TokenManager.decode_access_token(
+                f"{header}.{payload}.{forged.rsplit('.', 1)[1]}")
+
+    def test_decode_access_token_extra_segment(self):
+        """Test a token with a fourth segment is rejected."""
+        token = TokenManager.generate_access_token(123)
+
+        with pytest.raises(WrongCredentialsException):
+            TokenManager.decode_access_token(f"{token}.extra")
+
+    @pytest.mark.parametrize("junk", ["!", "*", "+", "=", "AA"])
+    def test_decode_access_token_junk_in_signature(self, junk):
+        """Test junk characters around a valid signature are rejected."""
+        token = TokenManager.generate_access_token(123)
+
+        with pytest.raises(WrongCredentialsException):
+            TokenManager.decode_access_token(token + junk)
+
+    def test_decode_access_token_expired(self):
+        """Test an expired token is rejected."""
+        with patch.object(TokenManager, '_get_expiration_timestamp',
+                          return_value=int(time.time()) - 10):
+            token = TokenManager.generate_access_token(123)
+
+        with pytest.raises(AccessTokenExpiredException):
+            TokenManager.decode_access_token(token)
+
+    def test_decode_access_token_expired_non_fast_path(self):
+        """Test jose-decoded tokens report expiry the same way."""
+        token = jwt.encode(
+            {"sub": "123", "exp": int(time.time()) - 10, "scope": "read"},
+            settings.token_settings.SECRET_KEY,
+            algorithm=settings.token_settings.ALGORITHM,
+        )
+
+        with pytest.raises(AccessTokenExpiredException):
+            TokenManager.decode_access_token(token)
+
+    def test_decode_access_token_extra_claims(self):
+        """Test tokens with other claims are still decoded."""
+        token = jwt.encode(
+            {"sub": "123", "exp": int(time.time()) + 60, "scope": "read"},
+            settings.token_settings.SECRET_KEY,
+            algorithm=settings.token_settings.ALGORITHM,
+        )
+
+        decoded = TokenManager.decode_access_token(token)
+
+        assert decoded["sub"] == "123"
+        assert decoded["scope"] == "read"
+
     def test_validate_access_token_expired(self):
         """Test validation of expired access token."""
         # Skip this test as it requires complex time mocking
         # The functionality is tested in integration tests
         pass
 
+    def test_validate_access_token_expired_with_now(self):
+        """Test expiry is checked against the provided current time."""
+        decoded = {"sub": "123", "exp": 1_700_000_000}
+
+        TokenManager.validate_access_token_expired(decoded,
+                                                   now=1_699_999_999.5)
+        with pytest.raises(AccessTokenExpiredException):
+            TokenManager.validate_access_token_expired(decoded,
+                                                       now=1_700_000_000)
+
     def test_validate_refresh_token_expired(self):
         """Test validation of expired refresh token."""
         from datetime import datetime, timedelta, timezone
@@ -145,29 +299,72 @@ class TestAuthService:
     async def test_auth_user_success(self, auth_service, mock_author_repo,
                                      sample_author_data):
         """Test successful user authentication."""
-        mock_author_repo.get_object.return_value = sample_author_data
+        mock_author_repo.get_auth_credentials.return_value = sample_author_data
 
         result = await auth_service.auth_user("test@example.com",
                                               "TestPass123!")
 
         assert result == sample_author_data
-        mock_author_repo.get_object.assert_called_once_with(
-            email="test@example.com")
+        mock_author_repo.get_auth_credentials.assert_called_once_with(
+            "test@example.com")
+        mock_author_repo.update_object.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_auth_user_rehashes_outdated_password(
+            self, auth_service, mock_author_repo, sample_author_data):
+        """Test a hash with outdated bcrypt rounds is replaced on login."""
+        sample_author_data["password"] = bcrypt.hashpw(
+            b"TestPass123!", bcrypt.gensalt(rounds=4)).decode()
+        mock_author_repo.get_auth_credentials.return_value = sample_author_data
+
+        await auth_service.auth_user("test@example.com", "TestPass123!")
+
+        mock_author_repo.update_object.assert_called_once()
+        update_data = mock_author_repo.update_object.call_args.args[0]
+        assert Hasher.verify_password("TestPass123!",
+                                      update_data["password"])
+        assert mock_author_repo.update_object.call_args.kwargs == {"id": 1}
+
+    @pytest.mark.asyncio
+    async def test_auth_user_rehash_evicts_cached_tokens(
+            self, mock_session, mock_auth_repo, mock_author_repo,
+            sample_author_data):
+        """Test replacing a password hash drops the author's cached tokens."""
+        cache = CachingTokenValidator()
+        cache.set("token", "1", time.time() + 60)
+        cache.set_author("token", {"id": 1, "name": "Test Author"})
+        service = AuthService(mock_session, mock_auth_repo, mock_author_repo,
+                              token_cache=cache)
+        sample_author_data["password"] = bcrypt.hashpw(
+            b"TestPass123!", bcrypt.gensalt(rounds=4)).decode()
+        mock_author_repo.get_auth_credentials.return_value = sample_author_data
+
+        await service.auth_user("test@example.com", "TestPass123!")
+
+        assert cache.get("token") is None
+        assert service.get_cached_author("token") is None
 
     @pytest.mark.asyncio
     async def test_auth_user_wrong_email(self, auth_service, mock_author_repo):
         """Test authentication with wrong email."""
-        mock_author_repo.get_object.return_value = None
+        mock_author_repo.get_auth_credentials.return_value = None
 
-        with pytest.raises(WrongCredentialsException):
-            await auth_service.auth_user("wrong@example.com", "TestPass123!")
+        with patch.object(Hasher, 'verify_and_update_async',
+                          new_callable=AsyncMock,
+                          return_value=(True, None)) as mock_verify:
+            with pytest.raises(WrongCredentialsException):
+                await auth_service.auth_user("wrong@example.com",
+                                             "TestPass123!")
+
+        # The password is still checked so unknown emails are not faster.
+        mock_verify.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_auth_user_wrong_password(self, auth_service,
                                             mock_author_repo,
                                             sample_author_data):
         """Test authentication with wrong password."""
-        mock_author_repo.get_object.return_value = sample_author_data
+        mock_author_repo.get_auth_credentials.return_value = sample_author_data
 
         with pytest.raises(WrongCredentialsException):
             await auth_service.auth_user("test@example.com", "WrongPassword!")
@@ -181,13 +378,15 @@ class TestAuthService:
                 'src.auth.services.auth.TokenManager') as mock_token_manager:
             mock_token_manager.generate_access_token.return_value = "access_token"
             mock_token_manager.generate_refresh_token.return_value = (
-                uuid.uuid4(), timedelta(hours=1))
+                uuid.uuid4(), 3600)
 
             result = await auth_service.create_token(author_id)
 
             assert isinstance(result, TokenSchemas)
             assert result.access_token == "access_token"
             assert isinstance(result.refresh_token, str)
+            mock_auth_repo.delete_expired_objects.assert_called_once_with(
+                author_id)
             mock_auth_repo.create_object.assert_called_once()
 
     @pytest.mark.asyncio
@@ -195,84 +394,54 @@ class TestAuthService:
                                          mock_author_repo):
         """Test successful token refresh."""
         refresh_token = uuid.uuid4()
-        refresh_token_model = {
-            "id": 1,
-            "author_id": 1,
-            "refresh_token": refresh_token,
-            "expires_in": 3600,
-            "created_at": datetime.now(timezone.utc)
-        }
-        author_data = {"id": 1, "name": "Test Author"}
-
-        mock_auth_repo.get_object.return_value = refresh_token_model
-        mock_author_repo.get_object.return_value = author_data
-        mock_auth_repo.update_object.return_value = {"id": 1}
+        new_refresh_token = uuid.uuid4()
+        mock_auth_repo.rotate_object.return_value = 1
 
         with patch(
                 'src.auth.services.auth.TokenManager') as mock_token_manager:
-            mock_token_manager.validate_refresh_token_expired.return_value = None
             mock_token_manager.generate_access_token.return_value = "new_access_token"
             mock_token_manager.generate_refresh_token.return_value = (
-                uuid.uuid4(), timedelta(hours=1))
+                new_refresh_token, 3600)
 
             result = await auth_service.refresh_token(refresh_token)
 
             assert isinstance(result, TokenSchemas)
             assert result.access_token == "new_access_token"
-            mock_auth_repo.update_object.assert_called_once()
+            assert result.refresh_token == str(new_refresh_token)
+            mock_auth_repo.rotate_object.assert_called_once_with(
+                refresh_token, new_refresh_token, 3600)
+            mock_token_manager.generate_access_token.assert_called_once_with(
+                author_id=1)
+            mock_author_repo.get_object.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_refresh_token_invalid_token(self, auth_service,
-                                               mock_auth_repo):
-        """Test token refresh with invalid refresh token."""
+    async def test_refresh_token_invalid_or_expired(self, auth_service,
+                                                    mock_auth_repo):
+        """Test token refresh with an unknown or expired refresh token."""
         refresh_token = uuid.uuid4()
-        mock_auth_repo.get_object.return_value = None
+        mock_auth_repo.rotate_object.return_value = None
 
         with pytest.raises(RefreshTokenException):
             await auth_service.refresh_token(refresh_token)
 
-    @pytest.mark.asyncio
-    async def test_refresh_token_expired(self, auth_service, mock_auth_repo):
-        """Test token refresh with expired refresh token."""
-        refresh_token = uuid.uuid4()
-        refresh_token_model = {
-            "id": 1,
-            "author_id": 1,
-            "refresh_token": refresh_token,
-            "expires_in": -3600,  # Expired
-            "created_at": datetime.now(timezone.utc) - timedelta(hours=2)
-        }
-
-        mock_auth_repo.get_object.return_value = refresh_token_model
-
-        with patch(
-                'src.auth.services.auth.TokenManager') as mock_token_manager:
-            mock_token_manager.validate_refresh_token_expired.side_effect = RefreshTokenException
-
-            with pytest.raises(RefreshTokenException):
-                await auth_service.refresh_token(refresh_token)
-
     @pytest.mark.asyncio
     async def test_logout_user_success(self, auth_service, mock_auth_repo):
         """Test successful user logout."""
         refresh_token = uuid.uuid4()
-        refresh_token_model = {"id": 1, "refresh_token": refresh_token}
-
-        mock_auth_repo.get_object.return_value = refresh_token_model
-        mock_auth_repo.delete_object.return_value = None
+        mock_auth_repo.delete_object.return_value = 1
 
         await auth_service.logout_user(refresh_token)
 
-        mock_auth_repo.get_object.assert_called_once_with(
+        mock_auth_repo.get_object.assert_not_called()
+        mock_auth_repo.delete_object.assert_called_once_with(
             refresh_token=refresh_token)
-        mock_auth_repo.delete_object.assert_called_once_with(id=1)
 
     @pytest.mark.asyncio
     async def test_logout_user_invalid_token(self, auth_service,
                                              mock_auth_repo):
         """Test logout with invalid refresh token."""
         refresh_token = uuid.uuid4()
-        mock_auth_repo.get_object.return_value = None
+        mock_auth_repo.delete_object.return_value = 0
 
         with pytest.raises(RefreshTokenException):
             await auth_service.logout_user(refresh_token)
@@ -298,3 +467,143 @@ class TestAuthService:
             result = await auth_service.validate_token_for_user(token)
 
             assert result == "123"
+
+    @pytest.mark.asyncio
+    async def test_validate_token_for_user_uses_cache(self, mock_session):
+        """Test repeated validation of a token skips decoding."""
+        token = "cached.jwt.token"
+        decoded_jwt = {"sub": "123",
+                       "exp": datetime.now(timezone.utc).timestamp() + 3600}
+        service = AuthService(mock_session, AsyncMock(), AsyncMock(),
+                              token_cache=CachingTokenValidator())
+
+        with patch(
+                'src.auth.services.auth.TokenManager') as mock_token_manager:
+            mock_token_manager.decode_access_token.return_value = decoded_jwt
+            mock_token_manager.validate_access_token_expired.return_value = None
+
+            assert await service.validate_token_for_user(token) == "123"
+            assert await service.validate_token_for_user(token) == "123"
+
+            mock_token_manager.decode_access_token.assert_called_once_with(
+                token=token, now=ANY)
+
+    @pytest.mark.asyncio
+    async def test_validate_token_for_user_invalid_cached_briefly(
+            self, mock_session):
+        """Test invalid tokens are rejected without decoding again."""
+        token = "invalid.jwt.token"
+        service = AuthService(mock_session, AsyncMock(), AsyncMock(),
+                              token_cache=CachingTokenValidator())
+
+        with patch(
+                'src.auth.services.auth.TokenManager') as mock_token_manager:
+            mock_token_manager.decode_access_token.side_effect = \
+                WrongCredentialsException
+
+            for _ in range(2):
+                with pytest.raises(WrongCredentialsException):
+                    await service.validate_token_for_user(token)
+
+            mock_token_manager.decode_access_token.assert_called_once_with(
+                token=token, now=ANY)
+            assert service.get_cached_author(token) is None
+
+    @pytest.mark.asyncio
+    async def test_validate_token_for_user_expired_not_cached(
+            self, mock_session):
+        """Test expired tokens are not remembered as invalid."""
+        cache = CachingTokenValidator()
+        service = AuthService(mock_session, AsyncMock(), AsyncMock(),
+                              token_cache=cache)
+        with patch.object(TokenManager, '_get_expiration_timestamp',
+                          return_value=int(time.time()) - 10):
+            token = TokenManager.generate_access_token(123)
+
+        with pytest.raises(AccessTokenExpiredException):
+            await service.validate_token_for_user(token)
+
+        assert cache.is_invalid(token) is False
+
+
+class TestCachingTokenValidator:
+    """Test the validated access token cache."""
+
+    def test_get_missing(self):
+        """Test lookup of an unknown token."""
+        assert CachingTokenValidator().get("unknown") is None
+
+    def test_expired_entry_is_dropped(self):
+        """Test entries are not returned after token expiration."""
+        cache = CachingTokenValidator()
+        cache.set("token", "1", time.time() - 1)
+
+        assert cache.get("token") is None
+
+    def test_max_size_evicts_oldest(self):
+        """Test the oldest entry is evicted when the cache is full."""
+        cache = CachingTokenValidator(max_size=2)
+        exp = time.time() + 60
+        cache.set("first", "1", exp)
+        cache.set("second", "2", exp)
+        cache.set("third", "3", exp)
+
+        assert cache.get("first") is None
+        assert cache.get("second") == "2"
+        assert cache.get("third") == "3"
+
+    def test_author_is_attached_to_cached_token(self):
+        """Test author records are stored with a cached token."""
+        cache = CachingTokenValidator()
+        cache.set("token", "1", time.time() + 60)
+        cache.set_author("token", {"id": 1, "name": "Test Author"})
+
+        assert cache.get_author("token") == {"id": 1, "name": "Test Author"}
+
+    def test_author_password_is_not_cached(self):
+        """Test the password hash is dropped from cached author records."""
+        cache = CachingTokenValidator()
+        cache.set("token", "1", time.time() + 60)
+        cache.set_author("token", {"id": 1, "password": "hash"})
+
+        assert cache.get_author("token") == {"id": 1}
+
+    def test_evict_author(self):
+        """Test evicting an author drops only that author's tokens."""
+        cache = CachingTokenValidator()
+        exp = time.time() + 60
+        cache.set("first", "1", exp)
+        cache.set("second", "1", exp)
+        cache.set("other", "2", exp)
+
+        cache.evict_author(1)
+
+        assert cache.get("first") is None
+        assert cache.get("second") is None
+        assert cache.get("other") == "2"
+
+    def test_invalid_entry_expires(self):
+        """Test invalid tokens are only remembered for a short time."""
+        cache = CachingTokenValidator(invalid_ttl=0)
+        cache.set_invalid("token")
+
+        assert cache.is_invalid("token") is False
+
+    def test_author_is_not_cached_without_token(self):
+        """Test authors are never cached for unvalidated tokens."""
+        cache = CachingTokenValidator()
+        cache.set_author("token", {"id": 1})
+
+        assert cache.get_author("token") is None
+
+
+class TestGetService:
+    """Test the service dependency factory."""
+
+    def test_get_service_is_memoized(self):
+        """Test the same dependency callable is returned per service."""
+        assert get_service(AuthService) is get_service(AuthService)
+
+    def test_get_service_distinct_per_service(self):
+        """Test different services get different dependency callables."""
+        assert get_service(AuthService) is not get_service(AuthorService)
@@ -1,11 +1,15 @@
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime, timezone
 
+from fastapi.exceptions import RequestValidationError
+
 from src.authors.service import AuthorService
 from src.authors.schemas import CreateAuthorRequestSchema
-from src.authors.exceptions import AuthorNotFoundByIdException
+from src.authors.exceptions import AuthorNotFoundByIdException, \
+    BadPasswordSchemaException
 from src.auth.services.hasher import Hasher
+from src.base.dependencies import get_json_body
 
 
 class TestAuthorService:
@@ -93,26 +97,22 @@ class TestAuthorService:
         author_service._repo.create_object.return_value = 123
         
         with patch('src.authors.service.Hasher') as mock_hasher:
-            mock_hasher.hash_password.return_value = "hashed_password"
+            mock_hasher.hash_password_async = AsyncMock()
+            mock_hasher.hash_password_async.return_value = "hashed_password"
+            
+            result = await author_service.create_author(sample_author_schema)
             
-            with patch('src.authors.service.dt') as mock_dt:
-                mock_now = datetime.now(timezone.utc)
-                mock_dt.now.return_value = mock_now
-                
-                result = await author_service.create_author(sample_author_schema)
-                
-                assert result == 123
-                author_service._repo.create_object.assert_called_once()
-                
-                # Verify the data passed to repository
-                call_args = author_service._repo.create_object.call_args[0][0]
-                assert call_args["email"] == "test@example.com"
-                assert call_args["password"] == "hashed_password"
-                assert call_args["name"] == "Test Author"
-                assert call_args["biography"] == "A test author for unit testing"
-                assert call_args["birth_year"] == 1990
-                assert call_args["nationality"] == "Test Country"
-                assert call_args["created_at"] == mock_now
+            assert result == 123
+            author_service._repo.create_object.assert_called_once()
+            
+            # Verify the data passed to repository
+            call_args = author_service._repo.create_object.call_args[0][0]
+            assert call_args["email"] == "test@example.com"
+            assert call_args["password"] == "hashed_password"
+            assert call_args["name"] == "Test Author"
+            assert call_args["biography"] == "A test author for unit testing"
+            assert call_args["birth_year"] == 1990
+            assert call_args["nationality"] == "Test Country"
     
     @pytest.mark.asyncio
     async def test_create_author_minimal_data(self, author_service):
@@ -128,26 +128,22 @@ class TestAuthorService:
         author_service._repo.create_object.return_value = 456
         
         with patch('src.authors.service.Hasher') as mock_hasher:
-            mock_hasher.hash_password.return_value = "hashed_password"
+            mock_hasher.hash_password_async = AsyncMock()
+            mock_hasher.hash_password_async.return_value = "hashed_password"
+            
+            result = await author_service.create_author(minimal_schema)
             
-            with patch('src.authors.service.dt') as mock_dt:
-                mock_now = datetime.now(timezone.utc)
-                mock_dt.now.return_value = mock_now
-                
-                result = await author_service.create_author(minimal_schema)
-                
-                assert result == 456
-                author_service._repo.create_object.assert_called_once()
-                
-                # Verify the data passed to repository
-                call_args = author_service._repo.create_object.call_args[0][0]
-                assert call_args["email"] == "minimal@example.com"
-                assert call_args["password"] == "hashed_password"
-                assert call_args["name"] == "Minimal Author"
-                assert call_args["biography"] is None
-                assert call_args["birth_year"] is None
-                assert call_args["nationality"] is None
-                assert call_args["created_at"] == mock_now
+            assert result == 456
+            author_service._repo.create_object.assert_called_once()
+            
+            # Verify the data passed to repository
+            call_args = author_service._repo.create_object.call_args[0][0]
+            assert call_args["email"] == "minimal@example.com"
+            assert call_args["password"] == "hashed_password"
+            assert call_args["name"] == "Minimal Author"
+            assert call_args["biography"] is None
+            assert call_args["birth_year"] is None
+            assert call_args["nationality"] is None
     
     @pytest.mark.asyncio
     async def test_create_author_password_hashing(self, author_service):
@@ -163,38 +159,104 @@ class TestAuthorService:
         author_service._repo.create_object.return_value = 789
         
         with patch('src.authors.service.Hasher') as mock_hasher:
-            mock_hasher.hash_password.return_value = "hashed_original_password"
+            mock_hasher.hash_password_async = AsyncMock()
+            mock_hasher.hash_password_async.return_value = "hashed_original_password"
+            
+            await author_service.create_author(schema)
             
-            with patch('src.authors.service.dt') as mock_dt:
-                mock_dt.now.return_value = datetime.now(timezone.utc)
-                
-                await author_service.create_author(schema)
-                
-                # Verify password was hashed
-                mock_hasher.hash_password.assert_called_once_with("OriginalPassword123!")
-                
-                # Verify hashed password was stored
-                call_args = author_service._repo.create_object.call_args[0][0]
-                assert call_args["password"] == "hashed_original_password"
+            # Verify password was hashed
+            mock_hasher.hash_password_async.assert_awaited_once_with("OriginalPassword123!")
+            
+            # Verify hashed password was stored
+            call_args = author_service._repo.create_object.call_args[0][0]
+            assert call_args["password"] == "hashed_original_password"
     
     @pytest.mark.asyncio
-    async def test_create_author_timestamp_set(self, author_service, sample_author_schema):
-        """Test that creation timestamp is properly set."""
+    async def test_create_author_timestamp_left_to_database(self, author_service, sample_author_schema):
+        """Test that the creation timestamp is left to the database."""
         # Mock the repository instance directly
         author_service._repo = AsyncMock()
         author_service._repo.create_object.return_value = 101
         
         with patch('src.authors.service.Hasher') as mock_hasher:
-            mock_hasher.hash_password.return_value = "hashed_password"
+            mock_hasher.hash_password_async = AsyncMock()
+            mock_hasher.hash_password_async.return_value = "hashed_password"
+            
+            await author_service.create_author(sample_author_schema)
             
-            with patch('src.authors.service.dt') as mock_dt:
-                expected_time = datetime.now(timezone.utc)
-                mock_dt.now.return_value = expected_time
-                
-                await author_service.create_author(sample_author_schema)
-                
-                # Verify timestamp was set
-                mock_dt.now.assert_called_once_with(timezone.utc)
-                
-                call_args = author_service._repo.create_object.call_args[0][0]
-                assert call_args["created_at"] == expected_time
+            call_args = author_service._repo.create_object.call_args[0][0]
+            assert "created_at" not in call_args
+
+
+class TestCreateAuthorRequestSchema:
+    """Test create author request schema validation."""
+
+    def test_strips_profile_fields(self):
+        """Test surrounding whitespace is stripped from profile fields."""
+        schema = CreateAuthorRequestSchema(
+            email=" test@example.com ",
+            password="TestPass123!",
+            name=" Test Author ",
+        )
+
+        assert schema.email == "test@example.com"
+        assert schema.name == "Test Author"
+
+    def test_password_with_surrounding_spaces_rejected(self):
+        """Test the password is not stripped before validation."""
+        with pytest.raises(BadPasswordSchemaException):
+            CreateAuthorRequestSchema(
+                email="test@example.com",
+                password=" Abcdef1! ",
+                name="Test Author",
+            )
+
+
+class TestGetJsonBody:
+    """Test the JSON body dependency used by author creation."""
+
+    @staticmethod
+    def _request(body: bytes):
+        request = Mock()
+        request.body = AsyncMock(return_value=body)
+        return request
+
+    @pytest.mark.asyncio
+    async def test_valid_body(self):
+        """Test a valid body is parsed into the schema."""
+        dependency = get_json_body(CreateAuthorRequestSchema)
+        body = (b'{"email": "test@example.com", "password": "TestPass123!",'
+                b' "name": "Test Author"}')
+
+        schema = await dependency(self._request(body))
+
+        assert isinstance(schema, CreateAuthorRequestSchema)
+        assert schema.email == "test@example.com"
+        assert schema.biography is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_body(self):
+        """Test validation errors are reported with body locations."""
+        dependency = get_json_body(CreateAuthorRequestSchema)
+        body = (b'{"email": "test@example.com", "password": "TestPass123!",'
+                b' "name": "A"}')
+
+        with pytest.raises(RequestValidationError) as exc_info:
+            await dependency(self._request(body))
+
+        assert exc_info.value.errors()[0]["loc"] == ("body", "name")
+
+    @pytest.mark.asyncio
+    async def test_malformed_json(self):
+        """Test malformed JSON is reported as a validation error."""
+        dependency = get_json_body(CreateAuthorRequestSchema)
+
+        with pytest.raises(RequestValidationError) as exc_info:
+            await dependency(self._request(b'{bad'))
+
+        assert exc_info.value.errors()[0]["type"] == "json_invalid"
+
+    def test_factory_is_memoized(self):
+        """Test the same dependency callable is returned per schema."""
+        assert (get_json_body(CreateAuthorRequestSchema)
+                is get_json_body(CreateAuthorRequestSchema))
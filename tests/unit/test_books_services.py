@@ -226,13 +226,17 @@ class TestBooksService:
             ]
             mock_factory.get_importer.return_value = mock_importer
             
-            mock_repo.create_object.return_value = 123
+            mock_repo.create_objects.return_value = [123]
             
             result = await books_service.import_books(sample_author, file)
             
             assert result.imported == 1
             assert result.book_ids == [123]
-            mock_repo.create_object.assert_called_once()
+            mock_repo.create_objects.assert_called_once()
+            books_data = mock_repo.create_objects.call_args[0][0]
+            assert len(books_data) == 1
+            assert books_data[0]["title"] == "Test Book"
+            assert books_data[0]["author_id"] == 1
     
     @pytest.mark.asyncio
     async def test_import_books_validation_error(self, books_service, sample_author):